@@ -1,6 +1,7 @@
 """Shared helpers for parsing, normalizing, and displaying keybind strings."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 _MOD_ORDER = ("ctrl", "shift", "alt")
@@ -41,6 +42,9 @@ _KEY_ALIASES = {
 }
 
 
+# Bind/key strings come from a tiny set (digits, F-keys, a few modifiers) and are re-normalized
+# on every profile pass and every hook event, so the pure string helpers are memoized.
+@lru_cache(maxsize=256)
 def normalize_key_token(token: str) -> str:
     """Normalize one key token (modifier or primary key) to canonical lowercase."""
     if not token:
@@ -71,6 +75,7 @@ def normalize_bind_from_parts(modifiers: set[str], primary_key: str) -> str:
     return key
 
 
+@lru_cache(maxsize=256)
 def normalize_bind(bind: str) -> str:
     """Normalize a bind string (e.g. 'Control + 1' -> 'ctrl+1')."""
     if not bind:
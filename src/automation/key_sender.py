@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Callable, Optional
 if TYPE_CHECKING:
     from src.models import AppConfig
 
-from src.models import ActionBarState, SlotState
+from src.models import ActionBarState
 from src.automation.binds import normalize_bind
 from src.automation.priority_rules import (
     manual_item_is_eligible,
@@ -57,9 +57,21 @@ class KeySender:
         # After sending a queued key, don't send priority key until this time (so game gets only the queued key).
         self._suppress_priority_until = 0.0
         self._single_fire_pending = False
+        self._load_timing()
 
     def update_config(self, config: "AppConfig") -> None:
         self._config = config
+        self._load_timing()
+
+    def _load_timing(self) -> None:
+        """Cache the config-derived values evaluate_and_send reads every frame."""
+        config = self._config
+        self._target_window_title = getattr(config, "target_window_title", "") or ""
+        self._min_interval_sec = (getattr(config, "min_press_interval_ms", 150) or 150) / 1000.0
+        self._allow_while_casting = bool(getattr(config, "allow_cast_while_casting", False))
+        self._queue_window_sec = (getattr(config, "queue_window_ms", 120) or 120) / 1000.0
+        self._queue_fire_delay_sec = (getattr(config, "queue_fire_delay_ms", 100) or 0) / 1000.0
+        self._gcd_sec = (getattr(config, "gcd_ms", 1500) or 1500) / 1000.0
 
     def request_single_fire(self) -> None:
         """Arm one key send for the next valid ready action."""
@@ -67,17 +79,15 @@ class KeySender:
 
     def is_target_window_active(self) -> bool:
         """True if foreground window matches target_window_title, or target is empty."""
-        return is_target_window_active(
-            getattr(self._config, "target_window_title", "") or ""
-        )
+        return is_target_window_active(self._target_window_title)
 
     def _find_blocking_cast(
         self, state: ActionBarState
     ) -> Optional[tuple[int, object]]:
         """Return first slot currently casting/channeling, if any."""
-        for slot in state.slots:
-            if slot.state in (SlotState.CASTING, SlotState.CHANNELING):
-                return slot.index, slot
+        casting = state.casting_slots()
+        if casting:
+            return casting[0].index, casting[0]
         return None
 
     def evaluate_and_send(
@@ -100,23 +110,15 @@ class KeySender:
         if not automation_enabled and not single_fire_pending:
             return None
 
-        min_interval_sec = (
-            getattr(self._config, "min_press_interval_ms", 150) or 150
-        ) / 1000.0
         now = time.time()
-        min_interval_ok = (now - self._last_send_time) >= min_interval_sec
+        min_interval_ok = (now - self._last_send_time) >= self._min_interval_sec
         window_ok = self.is_target_window_active()
 
-        allow_while_casting = bool(
-            getattr(self._config, "allow_cast_while_casting", False)
-        )
-        if not allow_while_casting:
+        if not self._allow_while_casting:
             blocking = self._find_blocking_cast(state)
             if blocking is not None:
                 blocking_index, blocking_slot = blocking
-                queue_window_sec = (
-                    getattr(self._config, "queue_window_ms", 120) or 120
-                ) / 1000.0
+                queue_window_sec = self._queue_window_sec
                 cast_ends_at = getattr(blocking_slot, "cast_ends_at", None)
                 if cast_ends_at is None or now < (cast_ends_at + queue_window_sec):
                     return {
@@ -127,6 +129,7 @@ class KeySender:
                     }
 
         slots_by_index = {s.index: s for s in state.slots}
+        ready_indices = {s.index for s in state.ready_slots()}
         # Queued key fires only when at least one slot-type priority item is READY
         # (used as a practical "GCD over" signal).
         any_priority_ready = any(
@@ -134,8 +137,7 @@ class KeySender:
                 isinstance(item, dict)
                 and str(item.get("type", "") or "").strip().lower() == "slot"
                 and isinstance(item.get("slot_index"), int)
-                and (slots_by_index.get(item["slot_index"]) is not None)
-                and bool(getattr(slots_by_index[item["slot_index"]], "is_ready", False))
+                and item["slot_index"] in ready_indices
             )
             for item in (priority_items or [])
         )
@@ -147,9 +149,7 @@ class KeySender:
                 if any_priority_ready and min_interval_ok and window_ok:
                     logger.info("Queue override SENT: %s", queued_override)
                     # Wait so we don't fire before the game's GCD is actually ready (visual ready can be 1 frame early).
-                    delay_sec = (
-                        getattr(self._config, "queue_fire_delay_ms", 100) or 0
-                    ) / 1000.0
+                    delay_sec = self._queue_fire_delay_sec
                     if delay_sec > 0:
                         time.sleep(delay_sec)
                     try:
@@ -162,7 +162,7 @@ class KeySender:
                         return None
                     self._last_send_time = now
                     # Suppress priority for one configured GCD so only the queued key reaches the game.
-                    gcd_sec = (getattr(self._config, "gcd_ms", 1500) or 1500) / 1000.0
+                    gcd_sec = self._gcd_sec
                     self._suppress_priority_until = now + max(0.0, gcd_sec)
                     if on_queued_sent:
                         on_queued_sent()
@@ -183,17 +183,13 @@ class KeySender:
             if source == "tracked":
                 slot_index = queued_override.get("slot_index")
                 if slot_index is not None and key:
-                    slot = slots_by_index.get(slot_index)
                     if (
-                        slot
-                        and slot.state == SlotState.READY
+                        slot_index in ready_indices
                         and any_priority_ready
                         and min_interval_ok
                         and window_ok
                     ):
-                        delay_sec = (
-                            getattr(self._config, "queue_fire_delay_ms", 100) or 0
-                        ) / 1000.0
+                        delay_sec = self._queue_fire_delay_sec
                         if delay_sec > 0:
                             time.sleep(delay_sec)
                         try:
@@ -206,7 +202,7 @@ class KeySender:
                             )
                             return None
                         self._last_send_time = now
-                        gcd_sec = (getattr(self._config, "gcd_ms", 1500) or 1500) / 1000.0
+                        gcd_sec = self._gcd_sec
                         self._suppress_priority_until = now + max(0.0, gcd_sec)
                         if on_queued_sent:
                             on_queued_sent()
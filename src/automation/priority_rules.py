@@ -30,10 +30,6 @@ def _red_glow_ready_from_snapshot(slot: SlotSnapshot) -> bool:
     return bool(getattr(slot, "red_glow_ready", False))
 
 
-def _red_glow_ready_from_state_dict(slot_state: dict[str, Any]) -> bool:
-    return bool(slot_state.get("red_glow_ready", False))
-
-
 def _activation_allows(
     item: dict,
     yellow_glow_ready: bool,
@@ -65,6 +61,17 @@ def _red_glow_ready_from_buff_state(item: dict, buff_states: Optional[dict[str,
     return bool(buff.get("red_glow_ready", False))
 
 
+def _is_plain_slot_item(item: dict) -> bool:
+    """True when the item is slot-gated with the "always" rule (the common case).
+
+    Only exact values that already normalize to "slot"/"always" qualify; anything else
+    goes through the full normalization path.
+    """
+    return item.get("ready_source") in (None, "", "slot") and item.get(
+        "activation_rule"
+    ) in (None, "", "always")
+
+
 def _buff_ready(
     item: dict,
     buff_states: Optional[dict[str, Any]],
@@ -96,18 +103,16 @@ def _buff_ready(
     return False
 
 
-def slot_item_is_eligible_for_snapshot(
+def _slot_item_eligible(
     item: dict,
-    slot: Optional[SlotSnapshot],
-    buff_states: Optional[dict[str, Any]] = None,
+    slot_ready: bool,
+    yellow_glow_ready: bool,
+    red_glow_ready: bool,
+    buff_states: Optional[dict[str, Any]],
 ) -> bool:
-    if slot is None:
-        return False
+    """Shared eligibility rules once slot readiness/glow flags have been extracted."""
     ready_source = normalize_ready_source(item.get("ready_source"), "slot")
     buff_gate_ready = _buff_ready(item, buff_states, "slot")
-    slot_ready = bool(getattr(slot, "is_ready", False))
-    yellow_glow_ready = bool(getattr(slot, "yellow_glow_ready", False))
-    red_glow_ready = _red_glow_ready_from_snapshot(slot)
     if ready_source == "slot":
         if not buff_gate_ready:
             return False
@@ -125,7 +130,6 @@ def slot_item_is_eligible_for_snapshot(
         if not slot_ready:
             return False
         return _activation_allows(item, yellow_glow_ready, red_glow_ready)
-        return False
     if not buff_gate_ready:
         return False
     if not slot_ready:
@@ -133,41 +137,22 @@ def slot_item_is_eligible_for_snapshot(
     return _activation_allows(item, yellow_glow_ready, red_glow_ready)
 
 
-def slot_item_is_eligible_for_state_dict(
+def slot_item_is_eligible_for_snapshot(
     item: dict,
-    slot_state: Optional[dict[str, Any]],
+    slot: Optional[SlotSnapshot],
     buff_states: Optional[dict[str, Any]] = None,
 ) -> bool:
-    if not isinstance(slot_state, dict):
-        return False
-    ready_source = normalize_ready_source(item.get("ready_source"), "slot")
-    buff_gate_ready = _buff_ready(item, buff_states, "slot")
-    slot_ready = str(slot_state.get("state", "") or "").strip().lower() == "ready"
-    yellow_glow_ready = bool(slot_state.get("yellow_glow_ready", False))
-    red_glow_ready = _red_glow_ready_from_state_dict(slot_state)
-    if ready_source == "slot":
-        if not buff_gate_ready:
-            return False
-        if not slot_ready:
-            return False
-        return _activation_allows(item, yellow_glow_ready, red_glow_ready)
-    if ready_source in ("buff_present", "buff_missing"):
-        red_glow_ready = _red_glow_ready_from_buff_state(item, buff_states) or red_glow_ready
-        if not buff_gate_ready:
-            # If buff gate fails, allow red override only when slot is actually ready.
-            return _dot_refresh_red_override(item, red_glow_ready) and slot_ready
-        # If buff gate passes, keep existing DoT red override behavior.
-        if _dot_refresh_red_override(item, red_glow_ready):
-            return True
-        if not slot_ready:
-            return False
-        return _activation_allows(item, yellow_glow_ready, red_glow_ready)
-        return False
-    if not buff_gate_ready:
-        return False
-    if not slot_ready:
+    if slot is None:
         return False
-    return _activation_allows(item, yellow_glow_ready, red_glow_ready)
+    if _is_plain_slot_item(item):
+        return bool(getattr(slot, "is_ready", False))
+    return _slot_item_eligible(
+        item,
+        bool(getattr(slot, "is_ready", False)),
+        bool(getattr(slot, "yellow_glow_ready", False)),
+        _red_glow_ready_from_snapshot(slot),
+        buff_states,
+    )
 
 
 def manual_item_is_eligible(item: dict, buff_states: Optional[dict[str, Any]] = None) -> bool:
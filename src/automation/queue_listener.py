@@ -21,6 +21,35 @@ def _normalize_key(name: str) -> str:
     return str(name or "").strip().lower()
 
 
+def _build_key_tables(
+    keybinds: list[str], priority_order: list[int]
+) -> tuple[frozenset[str], dict[str, int]]:
+    """Return (priority keys, tracked key -> first non-priority slot index) for the queue hook."""
+    priority_keys = set()
+    for idx in priority_order:
+        if idx < len(keybinds) and (keybinds[idx] or "").strip():
+            priority_keys.add(_normalize_key(keybinds[idx]))
+    tracked: dict[str, int] = {}
+    for slot_index, bind in enumerate(keybinds):
+        if slot_index in priority_order:
+            continue
+        if not (bind or "").strip():
+            continue
+        tracked.setdefault(_normalize_key(bind), slot_index)
+    return frozenset(priority_keys), tracked
+
+
+def _scan_codes_for(keyboard, names) -> Optional[frozenset[int]]:
+    """Scan codes for all key names, or None if any name cannot be resolved."""
+    codes: set[int] = set()
+    for name in names:
+        try:
+            codes.update(int(c) for c in keyboard.key_to_scan_codes(name))
+        except Exception:
+            return None
+    return frozenset(codes)
+
+
 class _QueueHookThread(QThread):
     """Runs keyboard.hook; on key-down, if key qualifies, calls set_queue_value(value). One queued action; new press replaces."""
 
@@ -36,6 +65,7 @@ class _QueueHookThread(QThread):
         self._get_queue = get_queue
         self._set_queue_value = set_queue_value
         self._running = True
+        self._stop_event = threading.Event()
         self._hook = None
 
     def run(self) -> None:
@@ -47,15 +77,30 @@ class _QueueHookThread(QThread):
             )
             return
 
+        key_down = keyboard.KEY_DOWN
+        # Key lookup tables derived from config; rebuilt when the config object, its version or the
+        # active profile changes (the profile decides which keys are priority keys).
+        tables: dict = {
+            "config": None,
+            "version": -1,
+            "profile_id": None,
+            "priority_keys": frozenset(),
+            "whitelist": frozenset(),
+            "tracked": {},
+            "scan_codes": None,
+        }
+
         def on_event(event):
-            if not self._running:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Queue hook: key=%s, type=%s",
+                    getattr(event, "name", None),
+                    getattr(event, "event_type", None),
+                )
+            # Cheapest rejections first: key-ups, stopped listener, automation off.
+            if getattr(event, "event_type", None) != key_down:
                 return
-            logger.debug("Queue hook: key=%s, type=%s", getattr(event, "name", None), getattr(event, "event_type", None))
-            if getattr(event, "event_type", None) != keyboard.KEY_DOWN:
-                return
-            name = getattr(event, "name", None)
-            key = _normalize_key(name or "")
-            if not key or key in _LEFT_MOUSE_NAMES:
+            if not self._running:
                 return
             try:
                 config = self._get_config()
@@ -63,44 +108,58 @@ class _QueueHookThread(QThread):
                 return
             if not getattr(config, "automation_enabled", False):
                 return
-            whitelist = getattr(config, "queue_whitelist", []) or []
-            keybinds = getattr(config, "keybinds", []) or []
-            priority_order = getattr(config, "priority_order", []) or []
-            priority_keys = set()
-            for idx in priority_order:
-                if idx < len(keybinds) and (keybinds[idx] or "").strip():
-                    priority_keys.add(_normalize_key(keybinds[idx]))
-            if key in priority_keys:
+            if (
+                tables["config"] is not config
+                or tables["version"] != config.version
+                or tables["profile_id"] != config.active_priority_profile_id
+            ):
+                whitelist = getattr(config, "queue_whitelist", []) or []
+                keybinds = getattr(config, "keybinds", []) or []
+                priority_order = getattr(config, "priority_order", []) or []
+                priority_keys, tracked = _build_key_tables(keybinds, priority_order)
+                tables["config"] = config
+                tables["version"] = config.version
+                tables["profile_id"] = config.active_priority_profile_id
+                tables["priority_keys"] = priority_keys
+                tables["whitelist"] = frozenset(whitelist)
+                tables["tracked"] = tracked
+                # Only whitelist/tracked keys can queue anything; None disables the pre-filter.
+                tables["scan_codes"] = _scan_codes_for(keyboard, set(whitelist) | set(tracked))
+            # Integer pre-filter: most keystrokes (movement etc.) are not queueable at all.
+            scan_codes = tables["scan_codes"]
+            scan_code = getattr(event, "scan_code", None)
+            if scan_codes is not None and scan_code is not None and scan_code not in scan_codes:
                 return
-            if key in whitelist:
+            name = getattr(event, "name", None)
+            key = _normalize_key(name or "")
+            if not key or key in _LEFT_MOUSE_NAMES:
+                return
+            if key in tables["priority_keys"]:
+                return
+            if key in tables["whitelist"]:
                 existing = self._get_queue()
                 if existing and existing.get("key") == key and existing.get("source") == "whitelist":
                     return
                 self._set_queue_value({"key": key, "source": "whitelist"})
                 return
-            for slot_index, bind in enumerate(keybinds):
-                if slot_index in priority_order:
-                    continue
-                if not (bind or "").strip():
-                    continue
-                if _normalize_key(bind) == key:
-                    existing = self._get_queue()
-                    if (
-                        existing
-                        and existing.get("source") == "tracked"
-                        and existing.get("slot_index") == slot_index
-                    ):
-                        return
-                    self._set_queue_value({"key": key, "slot_index": slot_index, "source": "tracked"})
+            slot_index = tables["tracked"].get(key)
+            if slot_index is not None:
+                existing = self._get_queue()
+                if (
+                    existing
+                    and existing.get("source") == "tracked"
+                    and existing.get("slot_index") == slot_index
+                ):
                     return
+                self._set_queue_value({"key": key, "slot_index": slot_index, "source": "tracked"})
 
         try:
             self._hook = keyboard.hook(on_event)
         except Exception as e:
             logger.debug("queue listener hook failed: %s", e)
             return
-        while self._running:
-            self.msleep(200)
+        # Block until stop(); the hook runs on keyboard's own thread, so no polling needed.
+        self._stop_event.wait()
         if self._hook is not None:
             try:
                 keyboard.unhook(self._hook)
@@ -110,13 +169,16 @@ class _QueueHookThread(QThread):
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
 
 
 class QueueListener(QObject):
     """Listens for keypresses and sets a single queued override (whitelist or tracked slot not in priority).
     Emits queue_updated when queue is set or cleared. get_queue() returns current queue or None; if older
     than queue_timeout_ms, returns None and clears. clear_queue() clears and emits. Does not trigger on
-    priority keys or left mouse. When automation is OFF, keypresses are ignored."""
+    priority keys or left mouse. When automation is OFF, keypresses are ignored.
+
+    The queue dict is built once per keypress and shared with every reader; treat it as read-only."""
 
     queue_updated = pyqtSignal(object)  # dict or None
 
@@ -133,7 +195,7 @@ class QueueListener(QObject):
             return self._queue
 
     def get_queue(self) -> Optional[dict]:
-        """Return current queue or None. If queue is older than queue_timeout_ms, clear and return None."""
+        """Return current queue (shared, read-only) or None. If older than queue_timeout_ms, clear and return None."""
         try:
             config = self._get_config()
             timeout_ms = getattr(config, "queue_timeout_ms", 5000) or 5000
@@ -144,17 +206,14 @@ class QueueListener(QObject):
         with self._lock:
             if self._queue is None:
                 return None
-            age_ms = (time.time() - self._queue_time) * 1000
-            logger.debug("Queue age: %sms, timeout: %sms", age_ms, timeout_ms)
-            if (time.time() - self._queue_time) >= timeout_sec:
-                self._queue = None
-                self._queue_time = 0.0
-                need_emit = True
-            else:
-                need_emit = False
-                return self._queue.copy()
-        if need_emit:
-            self.queue_updated.emit(None)
+            age_sec = time.monotonic() - self._queue_time
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Queue age: %sms, timeout: %sms", age_sec * 1000, timeout_ms)
+            if age_sec < timeout_sec:
+                return self._queue
+            self._queue = None
+            self._queue_time = 0.0
+        self.queue_updated.emit(None)
         return None
 
     def clear_queue(self) -> None:
@@ -171,9 +230,10 @@ class QueueListener(QObject):
             return
 
         def set_value(value: dict) -> None:
+            # The hook builds a fresh dict per keypress, so store it as-is (no copy).
             with self._lock:
-                self._queue = value.copy()
-                self._queue_time = time.time()
+                self._queue = value
+                self._queue_time = time.monotonic()
             self.queue_updated.emit(value)
 
         self._thread = _QueueHookThread(
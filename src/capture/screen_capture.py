@@ -29,7 +29,24 @@ class ScreenCapture:
         self._sct = mss.mss()
         monitors = self._sct.monitors
         logger.info(f"Available monitors: {len(monitors) - 1} (indices 1..{len(monitors) - 1})")
-        if self._monitor_index >= len(monitors):
+        self._select_monitor(self._monitor_index)
+
+    def set_monitor_index(self, monitor_index: int) -> None:
+        """Switch the captured monitor, re-enumerating monitors first.
+
+        mss caches the monitor list for the life of its context, so a monitor plugged in,
+        removed or rearranged since start() would otherwise give stale geometry or a bad
+        index. Reopening the context is the only public way to refresh it; this runs on
+        user actions (calibration, monitor changes), not per frame.
+        """
+        if self._sct:
+            self._sct.close()
+            self._sct = mss.mss()
+        self._select_monitor(monitor_index)
+
+    def _select_monitor(self, monitor_index: int) -> None:
+        self._monitor_index = monitor_index
+        if self._sct and self._monitor_index >= len(self._sct.monitors):
             logger.warning(
                 f"Monitor {self._monitor_index} not found, falling back to monitor 1"
             )
@@ -48,11 +65,28 @@ class ScreenCapture:
             raise RuntimeError("Capture not started. Call start() first.")
         return self._sct.monitors[self._monitor_index]
 
-    def grab_region(self, bbox: BoundingBox) -> np.ndarray:
+    def mss_region(self, bbox: BoundingBox) -> dict:
+        """Absolute mss region dict for a bbox relative to the selected monitor."""
+        monitor = self.monitor_info
+        return bbox.as_mss_region(
+            monitor_offset_x=monitor["left"],
+            monitor_offset_y=monitor["top"],
+        )
+
+    def grab_region(
+        self,
+        bbox: BoundingBox,
+        out: Optional[np.ndarray] = None,
+        region: Optional[dict] = None,
+    ) -> np.ndarray:
         """Capture a region and return as a numpy BGR array.
 
         Args:
             bbox: The bounding box relative to the selected monitor.
+            out: Optional contiguous (height, width, 3) uint8 buffer to fill instead of
+                allocating; replaced by a fresh buffer if its shape does not match.
+            region: Optional precomputed mss_region(bbox), for callers grabbing the same
+                bbox every frame.
 
         Returns:
             numpy array of shape (height, width, 3) in BGR format.
@@ -60,16 +94,19 @@ class ScreenCapture:
         if not self._sct:
             raise RuntimeError("Capture not started. Call start() first.")
 
-        monitor = self._sct.monitors[self._monitor_index]
-        region = bbox.as_mss_region(
-            monitor_offset_x=monitor["left"],
-            monitor_offset_y=monitor["top"],
-        )
+        if region is None:
+            region = self.mss_region(bbox)
 
         # mss returns BGRA, convert to BGR for OpenCV compatibility
         raw = self._sct.grab(region)
-        frame = np.array(raw, dtype=np.uint8)
-        return frame[:, :, :3]  # Drop alpha channel
+        if out is None:
+            frame = np.array(raw, dtype=np.uint8)
+            return frame[:, :, :3]  # Drop alpha channel
+        bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+        if out.shape != (raw.height, raw.width, 3):
+            out = np.empty((raw.height, raw.width, 3), dtype=np.uint8)
+        np.copyto(out, bgra[:, :, :3])
+        return out
 
     def list_monitors(self) -> list[dict]:
         """List all available monitors with their geometry."""
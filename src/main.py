@@ -6,9 +6,11 @@ Wires together: screen capture → slot analysis → UI + overlay.
 from __future__ import annotations
 
 import base64
-import json
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import cv2
@@ -23,7 +25,13 @@ from src.automation.key_sender import KeySender
 from src.automation.queue_listener import QueueListener
 from src.capture import ScreenCapture
 from src.analysis import SlotAnalyzer
-from src.models import AppConfig, BoundingBox
+from src.models import AppConfig, BoundingBox, SlotSnapshot
+from src.models.config_io import (
+    decode_baselines,
+    encode_baselines,
+    read_json,
+    write_baselines_sidecar,
+)
 from src.overlay import CalibrationOverlay
 from src.ui import MainWindow
 from src.ui.settings_dialog import SettingsDialog
@@ -31,27 +39,6 @@ from src.ui.settings_dialog import SettingsDialog
 import numpy as np
 
 
-def encode_baselines(baselines: dict[int, np.ndarray]) -> list[dict]:
-    """Encode baselines for JSON: list of {shape: [h, w], data: base64} in slot order."""
-    return [
-        {"shape": list(ary.shape), "data": base64.b64encode(ary.tobytes()).decode()}
-        for i in sorted(baselines.keys())
-        for ary in [baselines[i]]
-    ]
-
-
-def decode_baselines(data: list[dict]) -> dict[int, np.ndarray]:
-    """Decode baselines from config (list of {shape, data})."""
-    result = {}
-    for i, d in enumerate(data):
-        shape = d.get("shape")
-        b64 = d.get("data")
-        if shape and b64:
-            arr = np.frombuffer(base64.b64decode(b64), dtype=np.uint8)
-            result[i] = arr.reshape(shape).copy()
-    return result
-
-
 def encode_gray_template(gray: np.ndarray) -> dict:
     return {
         "shape": [int(gray.shape[0]), int(gray.shape[1])],
@@ -73,13 +60,42 @@ CONFIG_PATH = PROJECT_ROOT / "config" / "default_config.json"
 ICON_PATH = _BASE_PATH / "cocktus.ico"
 
 
+@dataclass(slots=True)
+class FrameTick:
+    """Per-frame UI payload (preview, slot snapshots, buff and cast-bar debug) as one queued signal.
+
+    The snapshots are built fresh by SlotAnalyzer each frame and never mutated afterwards,
+    so they are handed to the UI as-is instead of being re-serialized into dicts.
+    """
+
+    frame: np.ndarray  # Action-bar crop for preview
+    slot_states: list[SlotSnapshot]
+    buff_states: dict  # Buff ROI states by id
+    cast_bar_debug: dict  # Live cast-bar ROI motion/status info
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _WorkerConfig:
+    """Immutable snapshot of the config values CaptureWorker reads every tick.
+
+    eq=False: snapshots compare by identity, so each update_config yields a distinct cache key.
+    """
+
+    config: AppConfig  # The config this snapshot was taken from (capture plan source)
+    interval_s: float
+    monitor_index: int
+    action_width: int
+    action_height: int
+    keybinds: list[str]
+    priority_items: list[dict]
+    manual_actions: list[dict]
+    automation_enabled: bool
+
+
 class CaptureWorker(QThread):
     """Worker thread that captures frames and analyzes them at the configured FPS."""
 
-    frame_captured = pyqtSignal(np.ndarray)  # Raw frame for preview
-    state_updated = pyqtSignal(list)  # List of slot state dicts
-    buff_state_updated = pyqtSignal(object)  # Dict of buff ROI states
-    cast_bar_debug = pyqtSignal(object)  # Live cast-bar ROI motion/status info
+    frame_tick = pyqtSignal(object)  # FrameTick
     key_action = pyqtSignal(
         object
     )  # Dict when a key was sent or blocked (action, keybind, etc.)
@@ -93,6 +109,42 @@ class CaptureWorker(QThread):
         self._running = False
         self._capture: ScreenCapture | None = None
         self._active_monitor_index: int | None = None
+        self._cached: _WorkerConfig | None = None
+        # (config snapshot, monitor geometry) -> (capture bbox, action origin, mss region).
+        # Only the worker thread touches these; a new snapshot from update_config invalidates the key.
+        self._capture_plan_key: tuple[_WorkerConfig, int, int, int, int] | None = None
+        self._capture_plan_value: tuple[BoundingBox, tuple[int, int], dict] | None = None
+        self._timer: QTimer | None = None
+        # Two capture buffers alternate so the one handed to the GUI is never overwritten
+        # while it may still be read; at most one FrameTick is in flight and frames captured
+        # while it is pending are not sent to the GUI (drop while pending).
+        self._frame_buffers: list[np.ndarray | None] = [None, None]
+        self._frame_buffer_idx = 0
+        self._frame_tick_pending = False
+        # Capture errors can repeat every tick (e.g. bbox off-screen after a resolution change);
+        # full tracebacks are logged at most once per second with a count of the skipped ones.
+        self._last_error_logged_at = 0.0
+        self._suppressed_errors = 0
+        self._refresh_config_cache()
+
+    def _refresh_config_cache(self) -> None:
+        """Snapshot the config values the capture loop reads every frame.
+
+        Rebuilt on update_config and swapped in as one attribute, so each tick sees a
+        consistent set and the active profile is not re-normalized per frame.
+        """
+        config = self._config
+        self._cached = _WorkerConfig(
+            config=config,
+            interval_s=1.0 / max(1, config.polling_fps),
+            monitor_index=config.monitor_index,
+            action_width=int(config.bounding_box.width),
+            action_height=int(config.bounding_box.height),
+            keybinds=list(config.keybinds),
+            priority_items=config.active_priority_items(),
+            manual_actions=config.active_manual_actions(),
+            automation_enabled=bool(getattr(config, "automation_enabled", False)),
+        )
 
     def set_queue_listener(self, listener) -> None:
         """Set the spell queue listener so the worker can pass queued override and clear on send."""
@@ -109,15 +161,17 @@ class CaptureWorker(QThread):
         self._start_capture(monitor_index)
         logger.info(f"Capture worker switched to monitor {monitor_index}")
 
-    def _capture_plan(self, monitor_width: int, monitor_height: int) -> tuple[BoundingBox, tuple[int, int]]:
+    def _capture_plan(
+        self, config: AppConfig, monitor_width: int, monitor_height: int
+    ) -> tuple[BoundingBox, tuple[int, int]]:
         """Return capture bbox (expanded for cast ROI and buff ROIs) and action origin inside it."""
-        action_bbox = self._config.bounding_box
+        action_bbox = config.bounding_box
         left = int(action_bbox.left)
         top = int(action_bbox.top)
         right = left + int(action_bbox.width)
         bottom = top + int(action_bbox.height)
 
-        cast_region = getattr(self._config, "cast_bar_region", {}) or {}
+        cast_region = getattr(config, "cast_bar_region", {}) or {}
         if bool(cast_region.get("enabled", False)):
             cast_w = int(cast_region.get("width", 0))
             cast_h = int(cast_region.get("height", 0))
@@ -132,7 +186,7 @@ class CaptureWorker(QThread):
                 bottom = max(bottom, cast_bottom)
 
         # Buff ROIs are relative to action bar and may sit outside action bbox.
-        for raw in list(getattr(self._config, "buff_rois", []) or []):
+        for raw in list(getattr(config, "buff_rois", []) or []):
             if not isinstance(raw, dict):
                 continue
             if not bool(raw.get("enabled", True)):
@@ -167,112 +221,171 @@ class CaptureWorker(QThread):
 
     def run(self) -> None:
         self._running = True
+        self._frame_tick_pending = False
         self._start_capture(self._config.monitor_index)
+        # Ticks are driven by a QTimer on this thread's event loop rather than a sleep loop,
+        # so idle time is spent in Qt's dispatcher and FPS changes apply in place.
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._tick, Qt.ConnectionType.DirectConnection)
+        self._apply_timer_interval()
         try:
-            interval = 1.0 / max(1, self._config.polling_fps)
             logger.info(f"Capture worker started at {self._config.polling_fps} FPS")
-
-            while self._running:
-                try:
-                    if self._active_monitor_index != self._config.monitor_index:
-                        self._restart_capture(self._config.monitor_index)
-                    monitor = self._capture.monitor_info
-                    capture_bbox, action_origin = self._capture_plan(
-                        monitor_width=int(monitor["width"]),
-                        monitor_height=int(monitor["height"]),
-                    )
-                    frame = self._capture.grab_region(capture_bbox)
-                    ax, ay = action_origin
-                    aw = int(self._config.bounding_box.width)
-                    ah = int(self._config.bounding_box.height)
-                    action_frame = frame[ay:ay + ah, ax:ax + aw]
-                    if action_frame.size == 0:
-                        action_frame = frame
-                    self.frame_captured.emit(action_frame)
-
-                    state = self._analyzer.analyze_frame(frame, action_origin=action_origin)
-                    slot_dicts = [
-                        {
-                            "index": s.index,
-                            "state": s.state.value,
-                            "keybind": (
-                                self._config.keybinds[s.index]
-                                if s.index < len(self._config.keybinds)
-                                else None
-                            ),
-                            "cooldown_remaining": s.cooldown_remaining,
-                            "cast_progress": s.cast_progress,
-                            "cast_ends_at": s.cast_ends_at,
-                            "last_cast_start_at": s.last_cast_start_at,
-                            "last_cast_success_at": s.last_cast_success_at,
-                            "glow_candidate": bool(getattr(s, "glow_candidate", False)),
-                            "glow_fraction": float(getattr(s, "glow_fraction", 0.0) or 0.0),
-                            "glow_ready": bool(getattr(s, "glow_ready", False)),
-                            "yellow_glow_candidate": bool(getattr(s, "yellow_glow_candidate", False)),
-                            "yellow_glow_fraction": float(
-                                getattr(s, "yellow_glow_fraction", 0.0) or 0.0
-                            ),
-                            "yellow_glow_ready": bool(getattr(s, "yellow_glow_ready", False)),
-                            "red_glow_candidate": bool(getattr(s, "red_glow_candidate", False)),
-                            "red_glow_fraction": float(getattr(s, "red_glow_fraction", 0.0) or 0.0),
-                            "red_glow_ready": bool(getattr(s, "red_glow_ready", False)),
-                            "brightness": s.brightness,
-                        }
-                        for s in state.slots
-                    ]
-                    # Snapshot queue at start of tick so priority never replaces it this tick.
-                    queued = self._queue_listener.get_queue() if self._queue_listener else None
-                    self.state_updated.emit(slot_dicts)
-                    buff_states = self._analyzer.buff_states()
-                    self.buff_state_updated.emit(buff_states)
-                    self.cast_bar_debug.emit(self._analyzer.cast_bar_debug())
-                    if self._key_sender is not None:
-                        on_queued_sent = (
-                            self._queue_listener.clear_queue if self._queue_listener else None
-                        )
-                        result = self._key_sender.evaluate_and_send(
-                            state,
-                            self._config.active_priority_items(),
-                            self._config.keybinds,
-                            self._config.active_manual_actions(),
-                            getattr(self._config, "automation_enabled", False),
-                            buff_states=buff_states,
-                            queued_override=queued,
-                            on_queued_sent=on_queued_sent,
-                        )
-                        if result is not None:
-                            self.key_action.emit(result)
-
-                except Exception as e:
-                    logger.error(f"Capture error: {e}", exc_info=True)
-
-                self.msleep(int(interval * 1000))
+            self._timer.start()
+            self.exec()
         finally:
+            self._timer.stop()
+            self._timer = None
             if self._capture is not None:
                 self._capture.stop()
 
+    def _apply_timer_interval(self) -> None:
+        """Sync the tick timer to the cached interval (must run on the worker thread)."""
+        interval_ms = max(1, int(round(self._cached.interval_s * 1000)))
+        if self._timer.interval() == interval_ms:
+            return
+        # Precise timers only when the default coarse timer's slack would cost frames.
+        self._timer.setTimerType(
+            Qt.TimerType.PreciseTimer if interval_ms < 20 else Qt.TimerType.CoarseTimer
+        )
+        self._timer.setInterval(interval_ms)
+
+    def _tick(self) -> None:
+        if not self._running:
+            # stop() may have called quit() before exec() was entered.
+            self.quit()
+            return
+        cached = self._cached
+        self._apply_timer_interval()
+        try:
+            if self._active_monitor_index != cached.monitor_index:
+                self._restart_capture(cached.monitor_index)
+            monitor = self._capture.monitor_info
+            plan_key = (
+                cached,
+                int(monitor["left"]),
+                int(monitor["top"]),
+                int(monitor["width"]),
+                int(monitor["height"]),
+            )
+            if self._capture_plan_key != plan_key:
+                plan_bbox, plan_origin = self._capture_plan(
+                    cached.config,
+                    monitor_width=plan_key[3],
+                    monitor_height=plan_key[4],
+                )
+                self._capture_plan_value = (
+                    plan_bbox,
+                    plan_origin,
+                    self._capture.mss_region(plan_bbox),
+                )
+                self._capture_plan_key = plan_key
+            capture_bbox, action_origin, region = self._capture_plan_value
+            buffer_idx = self._frame_buffer_idx
+            frame = self._capture.grab_region(
+                capture_bbox, out=self._frame_buffers[buffer_idx], region=region
+            )
+            self._frame_buffers[buffer_idx] = frame
+            ax, ay = action_origin
+            aw = cached.action_width
+            ah = cached.action_height
+            action_frame = frame[ay:ay + ah, ax:ax + aw]
+            if action_frame.size == 0:
+                action_frame = frame
+
+            state = self._analyzer.analyze_frame(frame, action_origin=action_origin)
+            # Snapshot queue at start of tick so priority never replaces it this tick.
+            queued = self._queue_listener.get_queue() if self._queue_listener else None
+            buff_states = self._analyzer.buff_states()
+            # Drop while pending: until the GUI has consumed the tick in flight, newer frames
+            # are not emitted (it shows that older frame); the next one goes out after it.
+            if not self._frame_tick_pending:
+                self._frame_tick_pending = True
+                self.frame_tick.emit(
+                    FrameTick(
+                        action_frame,
+                        state.slots,
+                        buff_states,
+                        self._analyzer.cast_bar_debug(),
+                    )
+                )
+                self._frame_buffer_idx ^= 1
+            if self._key_sender is not None:
+                on_queued_sent = (
+                    self._queue_listener.clear_queue if self._queue_listener else None
+                )
+                result = self._key_sender.evaluate_and_send(
+                    state,
+                    cached.priority_items,
+                    cached.keybinds,
+                    cached.manual_actions,
+                    cached.automation_enabled,
+                    buff_states=buff_states,
+                    queued_override=queued,
+                    on_queued_sent=on_queued_sent,
+                )
+                if result is not None:
+                    self.key_action.emit(result)
+
+        except Exception as e:
+            now = time.monotonic()
+            if now - self._last_error_logged_at < 1.0:
+                self._suppressed_errors += 1
+                return
+            suppressed = f" ({self._suppressed_errors} more suppressed)" if self._suppressed_errors else ""
+            logger.error(f"Capture error: {e}{suppressed}", exc_info=True)
+            self._last_error_logged_at = now
+            self._suppressed_errors = 0
+
     def stop(self) -> None:
         self._running = False
+        self.quit()
         self.wait()
 
+    def frame_tick_done(self) -> None:
+        """Called by the GUI after consuming a FrameTick so the next one can be emitted."""
+        self._frame_tick_pending = False
+
     def update_config(self, config: AppConfig) -> None:
         self._config = config
+        self._refresh_config_cache()
         self._analyzer.update_config(config)
         if self._key_sender is not None:
             self._key_sender.update_config(config)
 
+    def update_active_profile(self, config: AppConfig) -> None:
+        """Pick up an active profile switch: new priority snapshot, analyzer state untouched.
+
+        A profile only changes priority items, manual actions and binds, so the analyzer's
+        baselines, buff runtime and frame-change gate stay valid.
+        """
+        self._config = config
+        self._refresh_config_cache()
+        if self._key_sender is not None:
+            self._key_sender.update_config(config)
+
 
 def load_config() -> AppConfig:
     """Load config from JSON, falling back to defaults."""
     if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            data = json.load(f)
+        data = read_json(CONFIG_PATH)
         logger.info(f"Loaded config from {CONFIG_PATH}")
         return AppConfig.from_dict(data)
     logger.warning(f"Config not found at {CONFIG_PATH}, using defaults")
     return AppConfig()
 
 
+def load_startup_state() -> tuple[AppConfig, dict[int, np.ndarray]]:
+    """Load config and its saved baselines. File IO only, so it can run off the GUI thread."""
+    config = load_config()
+    baselines: dict[int, np.ndarray] = {}
+    if config.slot_baselines:
+        try:
+            baselines = decode_baselines(config.slot_baselines, CONFIG_PATH)
+        except Exception as e:
+            logger.warning(f"Could not load saved baselines: {e}")
+    return config, baselines
+
+
 def monitor_rect_for_index(monitor_index: int, monitors: list[dict]) -> QRect:
     """Resolve a monitor index (1-based) to a QRect, with safe fallback."""
     if monitors:
@@ -283,38 +396,48 @@ def monitor_rect_for_index(monitor_index: int, monitors: list[dict]) -> QRect:
 
 
 def main() -> None:
-    config = load_config()
+    # Config JSON and the baselines sidecar load on a pool thread while Qt initializes.
+    # (mss handles are thread-bound, so screen capture setup stays on the main thread.)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        startup = pool.submit(load_startup_state)
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion")
+        if ICON_PATH.exists():
+            app.setWindowIcon(QIcon(str(ICON_PATH)))
+        config, baselines = startup.result()
     config.automation_enabled = False
 
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    if ICON_PATH.exists():
-        app.setWindowIcon(QIcon(str(ICON_PATH)))
-
     # --- Initialize components ---
     analyzer = SlotAnalyzer(config)
-    if config.slot_baselines:
-        try:
-            decoded = decode_baselines(config.slot_baselines)
-            if decoded:
-                analyzer.set_baselines(decoded)
-        except Exception as e:
-            logger.warning(f"Could not load saved baselines: {e}")
+    if baselines:
+        analyzer.set_baselines(baselines)
 
     # --- Main window ---
     window = MainWindow(config)
 
-    def sync_baselines_to_config() -> None:
-        config.slot_baselines = encode_baselines(analyzer.get_baselines())
+    def sync_baselines_to_config(dest: Path | None = None) -> None:
+        """Copy the analyzer's baselines into config.slot_baselines.
+
+        dest is the config file about to be written: the baselines then go to its .npz sidecar
+        and the config stores a pointer. Without dest (e.g. right after calibrating) they are
+        only encoded in memory, so nothing reaches disk until the user saves.
+        """
+        baselines = analyzer.get_baselines()
+        if dest is not None and baselines:
+            config.slot_baselines = write_baselines_sidecar(dest, baselines)
+        else:
+            config.slot_baselines = encode_baselines(baselines)
 
     window.set_before_save_callback(sync_baselines_to_config)
 
     # --- Settings dialog (single instance, non-modal; close = hide) ---
     settings_dialog = SettingsDialog(config, before_save_callback=sync_baselines_to_config, parent=window)
 
-    # Short-lived mss on main thread for monitor list and overlay setup
+    # One mss context for the main thread (monitor list, overlay setup, calibration grabs).
+    # mss handles are thread-bound, so the capture worker keeps its own.
     capture = ScreenCapture(monitor_index=config.monitor_index)
     capture.start()
+    # Enumerated once; the settings dialog, overlay and monitor-change handlers share this list.
     monitors = capture.list_monitors()
     settings_dialog.populate_monitors(monitors)
     if getattr(config, "always_on_top", False):
@@ -323,7 +446,6 @@ def main() -> None:
 
     # --- Calibration overlay ---
     # Get the monitor geometry for overlay positioning
-    monitors = capture.list_monitors()
     monitor_rect = monitor_rect_for_index(config.monitor_index, monitors)
 
     overlay = CalibrationOverlay(monitor_geometry=monitor_rect)
@@ -333,16 +455,46 @@ def main() -> None:
     if config.overlay_enabled:
         overlay.show()
 
-    capture.stop()
-
     # --- Key sender and capture worker ---
     key_sender = KeySender(config)
     worker = CaptureWorker(analyzer, config, key_sender)
     window.set_key_sender(key_sender)
 
+    # Pre-stripped slot display names for on_key_action; rebuilt only when config changes.
+    display_names_cache: list[str] = []
+
+    def rebuild_display_names_cache() -> None:
+        display_names_cache[:] = [
+            (name or "").strip() for name in (getattr(config, "slot_display_names", []) or [])
+        ]
+
+    rebuild_display_names_cache()
+
+    # Normalized profile bind -> (profile, "toggle" | "single_fire"); first profile wins, as in
+    # the priority order. Replaced wholesale on config change because the hotkey listener thread
+    # polls it via all_profile_binds().
+    profile_binds: dict[str, tuple[dict, str]] = {}
+
+    def rebuild_profile_binds() -> None:
+        nonlocal profile_binds
+        binds: dict[str, tuple[dict, str]] = {}
+        for p in getattr(config, "priority_profiles", []) or []:
+            toggle_bind = normalize_bind(str(p.get("toggle_bind", "") or ""))
+            single_fire_bind = normalize_bind(str(p.get("single_fire_bind", "") or ""))
+            if toggle_bind:
+                binds.setdefault(toggle_bind, (p, "toggle"))
+            if single_fire_bind:
+                binds.setdefault(single_fire_bind, (p, "single_fire"))
+        profile_binds = binds
+
+    rebuild_profile_binds()
+
     def on_config_changed(new_config: AppConfig) -> None:
         nonlocal config
         config = new_config
+        config.mark_changed()
+        rebuild_display_names_cache()
+        rebuild_profile_binds()
         window.set_config(new_config)
         worker.update_config(new_config)
         key_sender.update_config(new_config)
@@ -375,31 +527,40 @@ def main() -> None:
     def apply_monitor(monitor_index: int) -> None:
         overlay.update_monitor_geometry(monitor_rect_for_index(monitor_index, monitors))
 
-    settings_dialog.bounding_box_changed.connect(overlay.update_bounding_box)
-    settings_dialog.slot_layout_changed.connect(overlay.update_slot_layout)
-    settings_dialog.overlay_visibility_changed.connect(apply_overlay_visibility)
-    settings_dialog.monitor_changed.connect(apply_monitor)
-    settings_dialog.config_updated.connect(on_config_changed)
+    # GUI-thread senders and receivers are wired Direct; signals emitted only from the capture
+    # worker thread are wired Queued. queue_updated is emitted from several threads, so it
+    # alone is left to AutoConnection.
+    settings_dialog.bounding_box_changed.connect(overlay.update_bounding_box, Qt.ConnectionType.DirectConnection)
+    settings_dialog.slot_layout_changed.connect(overlay.update_slot_layout, Qt.ConnectionType.DirectConnection)
+    settings_dialog.overlay_visibility_changed.connect(apply_overlay_visibility, Qt.ConnectionType.DirectConnection)
+    settings_dialog.monitor_changed.connect(apply_monitor, Qt.ConnectionType.DirectConnection)
+    settings_dialog.config_updated.connect(on_config_changed, Qt.ConnectionType.DirectConnection)
 
-    window.config_changed.connect(on_config_changed)
-    worker.frame_captured.connect(window.update_preview)
-    worker.state_updated.connect(window.update_slot_states)
-    worker.state_updated.connect(overlay.update_slot_states)
-    worker.buff_state_updated.connect(window.update_buff_states)
-    worker.buff_state_updated.connect(overlay.update_buff_states)
-    worker.cast_bar_debug.connect(window.update_cast_bar_debug)
+    window.config_changed.connect(on_config_changed, Qt.ConnectionType.DirectConnection)
+
+    def on_frame_tick(tick: FrameTick) -> None:
+        try:
+            window.update_preview(tick.frame)
+            window.update_slot_states(tick.slot_states)
+            overlay.update_slot_states(tick.slot_states)
+            window.update_buff_states(tick.buff_states)
+            overlay.update_buff_states(tick.buff_states)
+            window.update_cast_bar_debug(tick.cast_bar_debug)
+        finally:
+            worker.frame_tick_done()
+
+    worker.frame_tick.connect(on_frame_tick, Qt.ConnectionType.QueuedConnection)
 
     def on_key_action(result: dict) -> None:
         slot_index = result.get("slot_index")
         item_type = str(result.get("item_type", "") or "").strip().lower()
-        names = getattr(config, "slot_display_names", [])
         display_name = str(result.get("display_name", "") or "").strip() or "Unidentified"
         if item_type == "slot" and (
             slot_index is not None
-            and slot_index < len(names)
-            and (names[slot_index] or "").strip()
+            and slot_index < len(display_names_cache)
+            and display_names_cache[slot_index]
         ):
-            display_name = (names[slot_index] or "").strip()
+            display_name = display_names_cache[slot_index]
         if result.get("action") == "sent":
             window.record_last_action_sent(
                 result["keybind"], result.get("timestamp", 0.0), display_name
@@ -412,7 +573,7 @@ def main() -> None:
                 cast_ends_at=result.get("cast_ends_at"),
             )
 
-    worker.key_action.connect(on_key_action)
+    worker.key_action.connect(on_key_action, Qt.ConnectionType.QueuedConnection)
 
     # Emit initial slot layout so overlay draws slot outlines (from config; no window control)
     overlay.update_slot_layout(config.slot_count, config.slot_gap_pixels, config.slot_padding)
@@ -432,7 +593,7 @@ def main() -> None:
             window.set_capture_running(True)
             is_running[0] = True
 
-    window._btn_start.clicked.connect(toggle_capture)
+    window._btn_start.clicked.connect(toggle_capture, Qt.ConnectionType.DirectConnection)
 
     def on_start_capture_requested():
         if not is_running[0]:
@@ -441,41 +602,27 @@ def main() -> None:
             window.set_capture_running(True)
             is_running[0] = True
 
-    window.start_capture_requested.connect(on_start_capture_requested)
+    window.start_capture_requested.connect(on_start_capture_requested, Qt.ConnectionType.DirectConnection)
 
     # Global hotkey action (works when app does not have focus)
     def all_profile_binds() -> list[str]:
-        binds: list[str] = []
-        for p in getattr(config, "priority_profiles", []) or []:
-            toggle_bind = normalize_bind(str(p.get("toggle_bind", "") or ""))
-            single_fire_bind = normalize_bind(str(p.get("single_fire_bind", "") or ""))
-            if toggle_bind:
-                binds.append(toggle_bind)
-            if single_fire_bind:
-                binds.append(single_fire_bind)
-        return binds
+        return list(profile_binds)
 
     def on_hotkey_triggered(triggered_bind: str):
         bind = normalize_bind(triggered_bind or "")
         if not bind:
             return
-        matched_profile = None
-        matched_action = None
-        for p in getattr(config, "priority_profiles", []) or []:
-            if bind == normalize_bind(str(p.get("toggle_bind", "") or "")):
-                matched_profile = p
-                matched_action = "toggle"
-                break
-            if bind == normalize_bind(str(p.get("single_fire_bind", "") or "")):
-                matched_profile = p
-                matched_action = "single_fire"
-                break
-        if not matched_profile or not matched_action:
+        match = profile_binds.get(bind)
+        if match is None:
             return
+        matched_profile, matched_action = match
         profile_id = str(matched_profile.get("id", "") or "").strip().lower()
         profile_name = str(matched_profile.get("name", "") or "").strip() or "Profile"
         switched = config.set_active_priority_profile(profile_id)
         if switched:
+            # Switched in place (bypassing config_changed): refresh the worker's and key sender's
+            # profile snapshot so the next tick fires from the new profile's priority list.
+            worker.update_active_profile(config)
             window.set_active_priority_profile(profile_id, persist=True)
             window.show_status_message(f"Profile: {profile_name}", 1200)
         if matched_action == "single_fire":
@@ -485,11 +632,14 @@ def main() -> None:
         window.toggle_automation()
 
     hotkey_listener = GlobalToggleListener(get_binds=all_profile_binds)
-    hotkey_listener.triggered.connect(on_hotkey_triggered)
+    # The listener re-emits its hook thread's signal from the GUI thread, so this edge is Direct.
+    hotkey_listener.triggered.connect(on_hotkey_triggered, Qt.ConnectionType.DirectConnection)
     hotkey_listener.start()
 
     queue_listener = QueueListener(get_config=lambda: config)
-    queue_listener.queue_updated.connect(window.set_queued_override)
+    # Emitted on the GUI thread (automation toggle clears the queue), the capture worker (expiry,
+    # clear on send) and the keyboard hook thread (new key); Auto queues only the cross-thread ones.
+    queue_listener.queue_updated.connect(window.set_queued_override, Qt.ConnectionType.AutoConnection)
     queue_listener.start()
     worker.set_queue_listener(queue_listener)
     window.set_queue_listener(queue_listener)
@@ -513,10 +663,8 @@ def main() -> None:
             if reply != QMessageBox.StandardButton.Yes:
                 return
         try:
-            cap = ScreenCapture(monitor_index=config.monitor_index)
-            cap.start()
-            frame = cap.grab_region(config.bounding_box)
-            cap.stop()
+            capture.set_monitor_index(config.monitor_index)
+            frame = capture.grab_region(config.bounding_box)
             analyzer.calibrate_baselines(frame)
             logger.info("Baselines calibrated from current frame")
             sync_baselines_to_config()  # Update config in memory so baselines are not lost when switching windows
@@ -530,7 +678,16 @@ def main() -> None:
             btn.setStyleSheet("color: red;")
             QTimer.singleShot(2000, lambda: revert_calibrate_button(btn))
 
-    settings_dialog.calibrate_requested.connect(lambda: calibrate_baselines(settings_dialog._btn_calibrate))
+    def apply_imported_baselines(baselines: dict) -> None:
+        analyzer.set_baselines(baselines)
+        window.clear_overwritten_baseline_slots()
+        logger.info("Baselines loaded from imported config")
+
+    settings_dialog.baselines_imported.connect(apply_imported_baselines, Qt.ConnectionType.DirectConnection)
+
+    settings_dialog.calibrate_requested.connect(
+        lambda: calibrate_baselines(settings_dialog._btn_calibrate), Qt.ConnectionType.DirectConnection
+    )
 
     def calibrate_buff_roi_present(roi_id: str) -> None:
         rid = str(roi_id or "").strip().lower()
@@ -557,9 +714,8 @@ def main() -> None:
         right = max(int(action.left + action.width), int(action.left) + roi_left + roi_width)
         bottom = max(int(action.top + action.height), int(action.top) + roi_top + roi_height)
         try:
-            cap = ScreenCapture(monitor_index=config.monitor_index)
-            cap.start()
-            monitor = cap.monitor_info
+            capture.set_monitor_index(config.monitor_index)
+            monitor = capture.monitor_info
             mw = int(monitor["width"])
             mh = int(monitor["height"])
             left = max(0, min(left, mw - 1))
@@ -567,8 +723,7 @@ def main() -> None:
             right = max(left + 1, min(right, mw))
             bottom = max(top + 1, min(bottom, mh))
             bbox = BoundingBox(top=top, left=left, width=right - left, height=bottom - top)
-            frame = cap.grab_region(bbox)
-            cap.stop()
+            frame = capture.grab_region(bbox)
             action_origin = (int(action.left) - int(bbox.left), int(action.top) - int(bbox.top))
             x1 = int(action_origin[0]) + roi_left
             y1 = int(action_origin[1]) + roi_top
@@ -594,15 +749,13 @@ def main() -> None:
             window.show_status_message(f"Buff calibration failed: {e}", 2000)
 
     settings_dialog.calibrate_buff_present_requested.connect(
-        lambda rid: calibrate_buff_roi_present(rid)
+        lambda rid: calibrate_buff_roi_present(rid), Qt.ConnectionType.DirectConnection
     )
 
     def calibrate_single_slot(slot_index: int) -> None:
         try:
-            cap = ScreenCapture(monitor_index=config.monitor_index)
-            cap.start()
-            frame = cap.grab_region(config.bounding_box)
-            cap.stop()
+            capture.set_monitor_index(config.monitor_index)
+            frame = capture.grab_region(config.bounding_box)
             analyzer.calibrate_single_slot(frame, slot_index)
             window.mark_slot_recalibrated(slot_index)
             window.show_status_message(f"Slot {slot_index + 1} calibrated ✓", 2000)
@@ -610,10 +763,10 @@ def main() -> None:
             logger.error(f"Per-slot calibration failed: {e}")
             window.show_status_message(f"Calibration failed: {e}", 2000)
 
-    window.calibrate_slot_requested.connect(calibrate_single_slot)
+    window.calibrate_slot_requested.connect(calibrate_single_slot, Qt.ConnectionType.DirectConnection)
 
     # Settings button opens or raises the settings dialog
-    window._btn_settings.clicked.connect(settings_dialog.show_or_raise)
+    window._btn_settings.clicked.connect(settings_dialog.show_or_raise, Qt.ConnectionType.DirectConnection)
 
     # --- Run ---
     exit_code = app.exec()
@@ -623,6 +776,7 @@ def main() -> None:
     queue_listener.stop()
     if is_running[0]:
         worker.stop()
+    capture.stop()
     sys.exit(exit_code)
 
 
@@ -1,5 +1,6 @@
 from .slot import (
     SlotState,
+    SLOT_STATE_VALUES,
     SlotConfig,
     SlotSnapshot,
     ActionBarState,
@@ -9,6 +10,7 @@ from .slot import (
 
 __all__ = [
     "SlotState",
+    "SLOT_STATE_VALUES",
     "SlotConfig",
     "SlotSnapshot",
     "ActionBarState",
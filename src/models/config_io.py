@@ -0,0 +1,80 @@
+"""Config file IO: JSON (orjson when it is installed, stdlib json otherwise) and slot baselines."""
+
+from __future__ import annotations
+
+import base64
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is always available.
+    orjson = None
+
+
+def read_json(path: str | Path) -> Any:
+    """Parse a JSON file (read as UTF-8 bytes so both backends decode it the same way)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: str | Path, data: Any) -> None:
+    """Write data as 2-space indented JSON."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def encode_baselines(baselines: dict[int, np.ndarray]) -> list[dict]:
+    """Encode baselines for JSON: list of {shape: [h, w], data: base64} indexed by slot. No file IO.
+
+    Slots without a baseline get an empty entry, so sparse baselines keep their slot positions.
+    """
+    encoded: list[dict] = [{} for _ in range(max(baselines, default=-1) + 1)]
+    for i, ary in baselines.items():
+        encoded[i] = {"shape": list(ary.shape), "data": base64.b64encode(ary.tobytes()).decode()}
+    return encoded
+
+
+def write_baselines_sidecar(config_path: str | Path, baselines: dict[int, np.ndarray]) -> dict:
+    """Write baselines to the .npz sidecar next to config_path; return the JSON pointer {path}.
+
+    Only called when that config file is actually being written. The path is stored relative
+    to the config file's directory, so a config and its sidecar can be moved together.
+    Uncompressed: the crops are a few KB.
+    """
+    sidecar = Path(config_path).with_suffix(".baselines.npz")
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(sidecar, **{str(i): ary for i, ary in baselines.items()})
+    return {"path": sidecar.name}
+
+
+def decode_baselines(data: dict | list[dict], config_path: str | Path) -> dict[int, np.ndarray]:
+    """Decode baselines stored in the config file at config_path.
+
+    Accepts the sidecar pointer {path} (resolved against config_path's directory; absolute
+    paths pass through) or the embedded list of {shape, data}.
+    """
+    if isinstance(data, dict):
+        path = data.get("path")
+        if not path:
+            return {}
+        with np.load(Path(config_path).parent / path) as z:
+            return {int(k): z[k] for k in z.files}
+    result = {}
+    for i, d in enumerate(data or ()):
+        shape = d.get("shape")
+        b64 = d.get("data")
+        if shape and b64:
+            # Read-only view over the decoded bytes; SlotAnalyzer.set_baselines takes its own copy.
+            result[i] = np.frombuffer(base64.b64decode(b64), dtype=np.uint8).reshape(shape)
+    return result
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
-import numpy as np
-
 from src.automation.binds import normalize_bind
 
 
-class SlotState(Enum):
-    READY = "ready"
-    ON_COOLDOWN = "on_cooldown"
-    CASTING = "casting"
-    CHANNELING = "channeling"
-    LOCKED = "locked"
-    GCD = "gcd"
-    UNKNOWN = "unknown"
+class SlotState(IntEnum):
+    READY = 0
+    ON_COOLDOWN = 1
+    CASTING = 2
+    CHANNELING = 3
+    LOCKED = 4
+    GCD = 5
+    UNKNOWN = 6
+
+
+# String form of each state (UI styling, logs), indexed by SlotState.
+SLOT_STATE_VALUES: tuple[str, ...] = (
+    "ready",
+    "on_cooldown",
+    "casting",
+    "channeling",
+    "locked",
+    "gcd",
+    "unknown",
+)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SlotConfig:
     """Static configuration for a single action bar slot."""
     index: int
@@ -30,7 +40,9 @@ class SlotConfig:
     height: int = 40
 
 
-@dataclass
+# eq=False: snapshots are compared by index/state where needed, never as whole values,
+# so identity equality (and hashing) is enough.
+@dataclass(slots=True, eq=False)
 class SlotSnapshot:
     """The analyzed state of a single slot at a point in time."""
     index: int
@@ -52,33 +64,58 @@ class SlotSnapshot:
     red_glow_ready: bool = False
     brightness: float = 0.0
     timestamp: float = 0.0
+    # Derived from state once at construction (snapshots are not mutated afterwards);
+    # read many times per frame by the priority rules, key sender and UI.
+    is_ready: bool = field(init=False, repr=False)
+    is_casting: bool = field(init=False, repr=False)
 
-    @property
-    def is_ready(self) -> bool:
-        return self.state == SlotState.READY
+    def __post_init__(self) -> None:
+        state = self.state
+        self.is_ready = state == SlotState.READY
+        self.is_casting = state == SlotState.CASTING or state == SlotState.CHANNELING
 
-    @property
-    def is_casting(self) -> bool:
-        return self.state in (SlotState.CASTING, SlotState.CHANNELING)
 
-
-@dataclass
+@dataclass(slots=True)
 class ActionBarState:
-    """Complete state of all slots at a point in time."""
+    """Complete state of all slots at a point in time.
+
+    ready_slots/cooldown_slots/casting_slots return lists partitioned at construction;
+    treat them (and slots) as read-only.
+    """
     slots: list[SlotSnapshot] = field(default_factory=list)
     timestamp: float = 0.0
+    # Partitioned in one pass at construction; the slots list is fully built before the
+    # state is created and not mutated afterwards (snapshots are immutable too).
+    _ready: list[SlotSnapshot] = field(init=False, repr=False, compare=False)
+    _cooldown: list[SlotSnapshot] = field(init=False, repr=False, compare=False)
+    _casting: list[SlotSnapshot] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ready: list[SlotSnapshot] = []
+        cooldown: list[SlotSnapshot] = []
+        casting: list[SlotSnapshot] = []
+        for s in self.slots:
+            if s.is_ready:
+                ready.append(s)
+            elif s.is_casting:
+                casting.append(s)
+            elif s.state == SlotState.ON_COOLDOWN:
+                cooldown.append(s)
+        self._ready = ready
+        self._cooldown = cooldown
+        self._casting = casting
 
     def ready_slots(self) -> list[SlotSnapshot]:
-        return [s for s in self.slots if s.is_ready]
+        return self._ready
 
     def cooldown_slots(self) -> list[SlotSnapshot]:
-        return [s for s in self.slots if s.state == SlotState.ON_COOLDOWN]
+        return self._cooldown
 
     def casting_slots(self) -> list[SlotSnapshot]:
-        return [s for s in self.slots if s.is_casting]
+        return self._casting
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Screen-relative bounding box for capture region."""
     top: int = 900
@@ -100,7 +137,7 @@ class BoundingBox:
         return {"top": self.top, "left": self.left, "width": self.width, "height": self.height}
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Runtime application configuration."""
     monitor_index: int = 1
@@ -113,6 +150,10 @@ class AppConfig:
     brightness_drop_threshold: int = 40  # 0-255; pixel counts as darkened if brightness dropped by more
     cooldown_pixel_fraction: float = 0.30  # ON_COOLDOWN if this fraction of pixels darkened
     cooldown_min_duration_ms: int = 2000
+    # Reuse the previous slot states when a sparse sample of the frame differs from the last
+    # analyzed frame by less than this mean absolute delta per sampled value, 0-255
+    # (independent of capture size; 0 disables the gate).
+    frame_change_gate_threshold: float = 0.0
     # Extra detector: absolute baseline change fraction (captures bright overlays).
     cooldown_change_pixel_fraction: float = 0.30
     # Optional slot indexes where cooldown-change detector is ignored (dark detector still applies).
@@ -155,8 +196,8 @@ class AppConfig:
     keybinds: list[str] = field(default_factory=list)  # keybinds[slot_index] = key string, e.g. "5", "F"
     # User-defined display names per slot (e.g. "Fireball"); empty/missing = "Unidentified"
     slot_display_names: list[str] = field(default_factory=list)
-    # Persisted baselines: list of {"shape": [h, w], "data": base64} per slot (decoded at runtime in analyzer)
-    slot_baselines: list = field(default_factory=list)
+    # Persisted baselines: {"path": sidecar .npz} (legacy: list of {"shape": [h, w], "data": base64} per slot)
+    slot_baselines: list | dict = field(default_factory=list)
     # Slot indices that had their baseline set by "Calibrate This Slot" (show bold in UI)
     overwritten_baseline_slots: list[int] = field(default_factory=list)
     # Buff ROI templates used for buff-present / buff-missing readiness rules.
@@ -186,13 +227,25 @@ class AppConfig:
     queue_timeout_ms: int = 5000
     # Ms to wait after detecting GCD ready before sending queued key (avoids firing too early)
     queue_fire_delay_ms: int = 100
+    # Runtime-only change counter (not persisted); bumped by mark_changed() so consumers can
+    # invalidate config-derived caches with one int compare.
+    version: int = field(default=0, compare=False, repr=False)
+    # Inputs seen by the last _normalize_profiles() run; see _profiles_key().
+    _profiles_normalized_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def mark_changed(self) -> None:
+        """Record that this config was mutated in place."""
+        self.version += 1
 
     @staticmethod
-    def _normalize_manual_actions(raw_actions: object) -> list[dict]:
-        """Normalize profile manual actions to [{id, name, keybind}] with unique ids."""
+    def _normalize_manual_actions(raw_actions: object) -> tuple[list[dict], set[str]]:
+        """Normalize profile manual actions to [{id, name, keybind}] with unique ids.
+        Returns (actions, set of their ids)."""
         normalized: list[dict] = []
         seen_ids: set[str] = set()
-        for raw in list(raw_actions or []):
+        for raw in (raw_actions or ()):
             if not isinstance(raw, dict):
                 continue
             aid = str(raw.get("id", "") or "").strip().lower()
@@ -204,12 +257,12 @@ class AppConfig:
             name = str(raw.get("name", "") or "").strip() or aid.replace("_", " ").title()
             keybind = normalize_bind(str(raw.get("keybind", "") or ""))
             normalized.append({"id": aid, "name": name, "keybind": keybind})
-        return normalized
+        return normalized, seen_ids
 
     @staticmethod
     def _normalize_slot_keybinds(raw_keybinds: object) -> list[str]:
         normalized: list[str] = []
-        for raw in list(raw_keybinds or []):
+        for raw in (raw_keybinds or ()):
             normalized.append(normalize_bind(str(raw or "")))
         return normalized
 
@@ -247,7 +300,7 @@ class AppConfig:
     def _normalize_buff_rois(raw_rois: object) -> list[dict]:
         normalized: list[dict] = []
         seen_ids: set[str] = set()
-        for idx, raw in enumerate(list(raw_rois or []), start=1):
+        for idx, raw in enumerate(raw_rois or (), start=1):
             if not isinstance(raw, dict):
                 continue
             rid = str(raw.get("id", "") or "").strip().lower()
@@ -287,14 +340,21 @@ class AppConfig:
         return normalized
 
     @staticmethod
-    def _normalize_priority_items(raw_items: object, fallback_order: object) -> list[dict]:
+    def _normalize_priority_items(
+        raw_items: object, fallback_order: object, manual_action_ids: Optional[set[str]] = None
+    ) -> tuple[list[dict], list[int]]:
         """
         Normalize profile priority items to:
         [{type:'slot', slot_index:int, activation_rule:str} | {type:'manual', action_id:str}]
+        Returns (items, slot order) built in one pass. When manual_action_ids is given, manual items
+        referring to other ids are dropped (they still count as present for the fallback check).
         """
         normalized: list[dict] = []
-        for raw in list(raw_items or []):
+        slot_order: list[int] = []
+        any_valid = False
+        for raw in (raw_items or ()):
             if isinstance(raw, int):
+                any_valid = True
                 normalized.append(
                     {
                         "type": "slot",
@@ -304,6 +364,7 @@ class AppConfig:
                         "buff_roi_id": "",
                     }
                 )
+                slot_order.append(int(raw))
                 continue
             if not isinstance(raw, dict):
                 continue
@@ -311,6 +372,7 @@ class AppConfig:
             if itype == "slot":
                 slot_index = raw.get("slot_index")
                 if isinstance(slot_index, int):
+                    any_valid = True
                     normalized.append(
                         {
                             "type": "slot",
@@ -324,9 +386,13 @@ class AppConfig:
                             "buff_roi_id": str(raw.get("buff_roi_id", "") or "").strip().lower(),
                         }
                     )
+                    slot_order.append(int(slot_index))
             elif itype == "manual":
                 action_id = str(raw.get("action_id", "") or "").strip().lower()
                 if action_id:
+                    any_valid = True
+                    if manual_action_ids is not None and action_id not in manual_action_ids:
+                        continue
                     normalized.append(
                         {
                             "type": "manual",
@@ -337,27 +403,58 @@ class AppConfig:
                             "buff_roi_id": str(raw.get("buff_roi_id", "") or "").strip().lower(),
                         }
                     )
-        if normalized:
-            return normalized
-        return [
-            {
-                "type": "slot",
-                "slot_index": i,
-                "activation_rule": "always",
-                "ready_source": "slot",
-                "buff_roi_id": "",
-            }
-            for i in list(fallback_order or [])
-            if isinstance(i, int)
-        ]
-
-    def _normalize_profiles(self) -> None:
-        """Ensure automation profiles are valid and there is always an active profile."""
+        if any_valid:
+            return normalized, slot_order
+        fallback = [i for i in (fallback_order or ()) if isinstance(i, int)]
+        return (
+            [
+                {
+                    "type": "slot",
+                    "slot_index": i,
+                    "activation_rule": "always",
+                    "ready_source": "slot",
+                    "buff_roi_id": "",
+                }
+                for i in fallback
+            ],
+            [int(i) for i in fallback],
+        )
+
+    def _profiles_key(self) -> tuple:
+        """Cheap identity of the inputs _normalize_profiles() reads.
+
+        Catches list replacement, appends/removals and active profile switches. Nested edits made
+        in place are picked up on the next mark_changed() (every config_changed path calls it) or
+        an explicit ensure_priority_profiles().
+        """
+        profiles = self.priority_profiles
+        keybinds = self.keybinds
+        buff_rois = self.buff_rois
+        return (
+            self.version,
+            id(profiles),
+            len(profiles or ()),
+            id(keybinds),
+            len(keybinds or ()),
+            id(buff_rois),
+            len(buff_rois or ()),
+            self.active_priority_profile_id,
+        )
+
+    def _normalize_profiles(self, force: bool = False) -> None:
+        """Ensure automation profiles are valid and there is always an active profile.
+
+        Skipped when nothing it reads has changed since the last run (unless force), since the
+        UI asks for the active profile's items several times per frame.
+        """
+        if not force and self._profiles_normalized_key == self._profiles_key():
+            return
+        previous_active_id = self.active_priority_profile_id
         self.keybinds = self._normalize_slot_keybinds(self.keybinds)
         self.buff_rois = self._normalize_buff_rois(self.buff_rois)
         normalized: list[dict] = []
         seen_ids: set[str] = set()
-        for p in list(self.priority_profiles or []):
+        for p in (self.priority_profiles or ()):
             if not isinstance(p, dict):
                 continue
             pid = str(p.get("id", "") or "").strip().lower()
@@ -370,21 +467,12 @@ class AppConfig:
             order = p.get("priority_order", [])
             if not isinstance(order, list):
                 order = []
-            manual_actions = self._normalize_manual_actions(p.get("manual_actions", []))
-            manual_action_ids = {str(a.get("id", "") or "") for a in manual_actions}
-            priority_items = [
-                item
-                for item in self._normalize_priority_items(p.get("priority_items", []), order)
-                if (
-                    item.get("type") == "slot"
-                    or str(item.get("action_id", "") or "") in manual_action_ids
-                )
-            ]
-            slot_order = [
-                int(item["slot_index"])
-                for item in priority_items
-                if item.get("type") == "slot" and isinstance(item.get("slot_index"), int)
-            ]
+            manual_actions, manual_action_ids = self._normalize_manual_actions(
+                p.get("manual_actions", [])
+            )
+            priority_items, slot_order = self._normalize_priority_items(
+                p.get("priority_items", []), order, manual_action_ids
+            )
             toggle_bind = normalize_bind(str(p.get("toggle_bind", "") or ""))
             single_fire_bind = normalize_bind(str(p.get("single_fire_bind", "") or ""))
             normalized.append(
@@ -440,6 +528,9 @@ class AppConfig:
         self.priority_order = list(active_profile.get("priority_order", []))
         self.automation_toggle_bind = str(active_profile.get("toggle_bind", "") or "")
         self.automation_hotkey_mode = "toggle"
+        if self.active_priority_profile_id != previous_active_id:
+            self.mark_changed()
+        self._profiles_normalized_key = self._profiles_key()
 
     def get_active_priority_profile(self) -> dict:
         self._normalize_profiles()
@@ -449,7 +540,7 @@ class AppConfig:
         return self.priority_profiles[0]
 
     def ensure_priority_profiles(self) -> None:
-        self._normalize_profiles()
+        self._normalize_profiles(force=True)
 
     def set_active_priority_profile(self, profile_id: str) -> bool:
         self._normalize_profiles()
@@ -462,6 +553,7 @@ class AppConfig:
         active = self.get_active_priority_profile()
         self.priority_order = list(active.get("priority_order", []))
         self.automation_toggle_bind = str(active.get("toggle_bind", "") or "")
+        self.mark_changed()
         return True
 
     def active_priority_order(self) -> list[int]:
@@ -473,131 +565,129 @@ class AppConfig:
     def active_manual_actions(self) -> list[dict]:
         return list(self.get_active_priority_profile().get("manual_actions", []))
 
-    @classmethod
-    def from_dict(cls, data: dict) -> AppConfig:
-        bb = data.get("bounding_box", {})
-        raw_glow_delta_by_slot = data.get("detection", {}).get("glow_value_delta_by_slot", {})
-        if not isinstance(raw_glow_delta_by_slot, dict):
-            raw_glow_delta_by_slot = {}
-        raw_glow_ring_frac_by_slot = data.get("detection", {}).get("glow_ring_fraction_by_slot", {})
-        if not isinstance(raw_glow_ring_frac_by_slot, dict):
-            raw_glow_ring_frac_by_slot = {}
-        raw_glow_override_slots = data.get("detection", {}).get("glow_override_cooldown_by_slot", [])
-        if not isinstance(raw_glow_override_slots, list):
-            raw_glow_override_slots = []
-        raw_cooldown_change_ignore_slots = data.get("detection", {}).get(
-            "cooldown_change_ignore_by_slot", []
-        )
-        if not isinstance(raw_cooldown_change_ignore_slots, list):
-            raw_cooldown_change_ignore_slots = []
-        parsed_glow_delta_by_slot: dict[int, int] = {}
-        for k, v in raw_glow_delta_by_slot.items():
-            try:
-                slot_idx = int(k)
-                delta = int(v)
-            except Exception:
-                continue
-            if slot_idx < 0:
-                continue
-            parsed_glow_delta_by_slot[slot_idx] = max(0, min(255, delta))
-        parsed_glow_ring_frac_by_slot: dict[int, float] = {}
-        for k, v in raw_glow_ring_frac_by_slot.items():
+    @staticmethod
+    def _parse_slot_value_map(raw: object, cast: type, lo: float, hi: float) -> dict:
+        """Parse a {slot index: value} JSON object, skipping bad entries and clamping to [lo, hi]."""
+        parsed: dict = {}
+        if not isinstance(raw, dict):
+            return parsed
+        for k, v in raw.items():
             try:
                 slot_idx = int(k)
-                frac = float(v)
+                value = cast(v)
             except Exception:
                 continue
             if slot_idx < 0:
                 continue
-            parsed_glow_ring_frac_by_slot[slot_idx] = max(0.0, min(1.0, frac))
-        parsed_glow_override_slots: list[int] = []
-        seen_override_slots: set[int] = set()
-        for v in raw_glow_override_slots:
-            try:
-                slot_idx = int(v)
-            except Exception:
-                continue
-            if slot_idx < 0 or slot_idx in seen_override_slots:
-                continue
-            seen_override_slots.add(slot_idx)
-            parsed_glow_override_slots.append(slot_idx)
-        parsed_cooldown_change_ignore_slots: list[int] = []
-        seen_change_ignore_slots: set[int] = set()
-        for v in raw_cooldown_change_ignore_slots:
+            parsed[slot_idx] = max(lo, min(hi, value))
+        return parsed
+
+    @staticmethod
+    def _parse_slot_index_list(raw: object) -> list[int]:
+        """Parse a JSON list of slot indices, dropping invalid, negative and duplicate entries."""
+        parsed: list[int] = []
+        if not isinstance(raw, list):
+            return parsed
+        seen: set[int] = set()
+        for v in raw:
             try:
                 slot_idx = int(v)
             except Exception:
                 continue
-            if slot_idx < 0 or slot_idx in seen_change_ignore_slots:
+            if slot_idx < 0 or slot_idx in seen:
                 continue
-            seen_change_ignore_slots.add(slot_idx)
-            parsed_cooldown_change_ignore_slots.append(slot_idx)
+            seen.add(slot_idx)
+            parsed.append(slot_idx)
+        return parsed
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AppConfig:
+        bb = data.get("bounding_box") or {}
+        detection = data.get("detection") or {}
+        slots = data.get("slots") or {}
+        overlay = data.get("overlay") or {}
+        display = data.get("display") or {}
+        parsed_glow_delta_by_slot = cls._parse_slot_value_map(
+            detection.get("glow_value_delta_by_slot"), int, 0, 255
+        )
+        parsed_glow_ring_frac_by_slot = cls._parse_slot_value_map(
+            detection.get("glow_ring_fraction_by_slot"), float, 0.0, 1.0
+        )
+        parsed_glow_override_slots = cls._parse_slot_index_list(
+            detection.get("glow_override_cooldown_by_slot")
+        )
+        parsed_cooldown_change_ignore_slots = cls._parse_slot_index_list(
+            detection.get("cooldown_change_ignore_by_slot")
+        )
         hotkey_mode = (data.get("automation_hotkey_mode", "toggle") or "toggle").strip().lower()
         if hotkey_mode not in ("toggle", "single_fire"):
             hotkey_mode = "toggle"
         cfg = cls(
             monitor_index=data.get("monitor_index", 1),
             bounding_box=BoundingBox(**bb),
-            slot_count=data.get("slots", {}).get("count", 10),
-            slot_gap_pixels=data.get("slots", {}).get("gap_pixels", 2),
-            slot_padding=data.get("slots", {}).get("padding", 3),
-            polling_fps=data.get("detection", {}).get("polling_fps", 20),
-            brightness_threshold=data.get("detection", {}).get("brightness_threshold", 0.65),
-            brightness_drop_threshold=data.get("detection", {}).get(
+            slot_count=slots.get("count", 10),
+            slot_gap_pixels=slots.get("gap_pixels", 2),
+            slot_padding=slots.get("padding", 3),
+            polling_fps=detection.get("polling_fps", 20),
+            brightness_threshold=detection.get("brightness_threshold", 0.65),
+            brightness_drop_threshold=detection.get(
                 "brightness_drop_threshold",
-                data.get("detection", {}).get("saturation_drop_threshold", 40),
+                detection.get("saturation_drop_threshold", 40),
+            ),
+            cooldown_pixel_fraction=detection.get("cooldown_pixel_fraction", 0.30),
+            cooldown_min_duration_ms=detection.get("cooldown_min_duration_ms", 2000),
+            frame_change_gate_threshold=float(
+                detection.get("frame_change_gate_threshold", 0.0)
             ),
-            cooldown_pixel_fraction=data.get("detection", {}).get("cooldown_pixel_fraction", 0.30),
-            cooldown_min_duration_ms=data.get("detection", {}).get("cooldown_min_duration_ms", 2000),
-            cooldown_change_pixel_fraction=data.get("detection", {}).get(
+            cooldown_change_pixel_fraction=detection.get(
                 "cooldown_change_pixel_fraction",
-                data.get("detection", {}).get("cooldown_pixel_fraction", 0.30),
+                detection.get("cooldown_pixel_fraction", 0.30),
             ),
             cooldown_change_ignore_by_slot=parsed_cooldown_change_ignore_slots,
-            cast_detection_enabled=data.get("detection", {}).get("cast_detection_enabled", True),
-            cast_candidate_min_fraction=data.get("detection", {}).get("cast_candidate_min_fraction", 0.05),
-            cast_candidate_max_fraction=data.get("detection", {}).get("cast_candidate_max_fraction", 0.22),
-            cast_confirm_frames=data.get("detection", {}).get("cast_confirm_frames", 2),
-            cast_min_duration_ms=data.get("detection", {}).get("cast_min_duration_ms", 150),
-            cast_max_duration_ms=data.get("detection", {}).get("cast_max_duration_ms", 3000),
-            cast_cancel_grace_ms=data.get("detection", {}).get("cast_cancel_grace_ms", 120),
-            channeling_enabled=data.get("detection", {}).get("channeling_enabled", True),
-            queue_window_ms=data.get("detection", {}).get("queue_window_ms", 120),
-            allow_cast_while_casting=data.get("detection", {}).get("allow_cast_while_casting", False),
-            lock_ready_while_cast_bar_active=data.get("detection", {}).get(
+            cast_detection_enabled=detection.get("cast_detection_enabled", True),
+            cast_candidate_min_fraction=detection.get("cast_candidate_min_fraction", 0.05),
+            cast_candidate_max_fraction=detection.get("cast_candidate_max_fraction", 0.22),
+            cast_confirm_frames=detection.get("cast_confirm_frames", 2),
+            cast_min_duration_ms=detection.get("cast_min_duration_ms", 150),
+            cast_max_duration_ms=detection.get("cast_max_duration_ms", 3000),
+            cast_cancel_grace_ms=detection.get("cast_cancel_grace_ms", 120),
+            channeling_enabled=detection.get("channeling_enabled", True),
+            queue_window_ms=detection.get("queue_window_ms", 120),
+            allow_cast_while_casting=detection.get("allow_cast_while_casting", False),
+            lock_ready_while_cast_bar_active=detection.get(
                 "lock_ready_while_cast_bar_active",
                 False,
             ),
-            cast_bar_region=data.get("detection", {}).get("cast_bar_region", {}),
-            cast_bar_activity_threshold=data.get("detection", {}).get(
+            cast_bar_region=detection.get("cast_bar_region", {}),
+            cast_bar_activity_threshold=detection.get(
                 "cast_bar_activity_threshold",
                 12.0,
             ),
-            cast_bar_history_frames=data.get("detection", {}).get("cast_bar_history_frames", 8),
-            glow_enabled=data.get("detection", {}).get("glow_enabled", True),
-            glow_ring_thickness_px=int(data.get("detection", {}).get("glow_ring_thickness_px", 4)),
-            glow_value_delta=int(data.get("detection", {}).get("glow_value_delta", 35)),
+            cast_bar_history_frames=detection.get("cast_bar_history_frames", 8),
+            glow_enabled=detection.get("glow_enabled", True),
+            glow_ring_thickness_px=int(detection.get("glow_ring_thickness_px", 4)),
+            glow_value_delta=int(detection.get("glow_value_delta", 35)),
             glow_value_delta_by_slot=parsed_glow_delta_by_slot,
-            glow_saturation_min=int(data.get("detection", {}).get("glow_saturation_min", 80)),
-            glow_ring_fraction=float(data.get("detection", {}).get("glow_ring_fraction", 0.18)),
+            glow_saturation_min=int(detection.get("glow_saturation_min", 80)),
+            glow_ring_fraction=float(detection.get("glow_ring_fraction", 0.18)),
             glow_ring_fraction_by_slot=parsed_glow_ring_frac_by_slot,
             glow_red_ring_fraction=float(
-                data.get("detection", {}).get(
+                detection.get(
                     "glow_red_ring_fraction",
-                    data.get("detection", {}).get("glow_ring_fraction", 0.18),
+                    detection.get("glow_ring_fraction", 0.18),
                 )
             ),
             glow_override_cooldown_by_slot=parsed_glow_override_slots,
-            glow_confirm_frames=int(data.get("detection", {}).get("glow_confirm_frames", 2)),
-            glow_yellow_hue_min=int(data.get("detection", {}).get("glow_yellow_hue_min", 18)),
-            glow_yellow_hue_max=int(data.get("detection", {}).get("glow_yellow_hue_max", 42)),
-            glow_red_hue_max_low=int(data.get("detection", {}).get("glow_red_hue_max_low", 12)),
-            glow_red_hue_min_high=int(data.get("detection", {}).get("glow_red_hue_min_high", 168)),
-            ocr_enabled=data.get("detection", {}).get("ocr_enabled", True),
-            overlay_enabled=data.get("overlay", {}).get("enabled", True),
-            overlay_border_color=data.get("overlay", {}).get("border_color", "#00FF00"),
-            always_on_top=data.get("display", {}).get("always_on_top", False),
-            keybinds=cls._normalize_slot_keybinds(data.get("slots", {}).get("keybinds", [])),
+            glow_confirm_frames=int(detection.get("glow_confirm_frames", 2)),
+            glow_yellow_hue_min=int(detection.get("glow_yellow_hue_min", 18)),
+            glow_yellow_hue_max=int(detection.get("glow_yellow_hue_max", 42)),
+            glow_red_hue_max_low=int(detection.get("glow_red_hue_max_low", 12)),
+            glow_red_hue_min_high=int(detection.get("glow_red_hue_min_high", 168)),
+            ocr_enabled=detection.get("ocr_enabled", True),
+            overlay_enabled=overlay.get("enabled", True),
+            overlay_border_color=overlay.get("border_color", "#00FF00"),
+            always_on_top=display.get("always_on_top", False),
+            keybinds=cls._normalize_slot_keybinds(slots.get("keybinds", [])),
             slot_display_names=data.get("slot_display_names", []),
             slot_baselines=data.get("slot_baselines", []),
             overwritten_baseline_slots=data.get("overwritten_baseline_slots", []),
@@ -638,7 +728,7 @@ class AppConfig:
                             "ready_source": "slot",
                             "buff_roi_id": "",
                         }
-                        for i in list(data.get("priority_order", []))
+                        for i in (data.get("priority_order") or ())
                         if isinstance(i, int)
                     ],
                     "manual_actions": [],
@@ -668,9 +758,10 @@ class AppConfig:
                 "brightness_drop_threshold": self.brightness_drop_threshold,
                 "cooldown_pixel_fraction": self.cooldown_pixel_fraction,
                 "cooldown_min_duration_ms": self.cooldown_min_duration_ms,
+                "frame_change_gate_threshold": self.frame_change_gate_threshold,
                 "cooldown_change_pixel_fraction": self.cooldown_change_pixel_fraction,
                 "cooldown_change_ignore_by_slot": [
-                    int(v) for v in list(self.cooldown_change_ignore_by_slot or [])
+                    int(v) for v in (self.cooldown_change_ignore_by_slot or ())
                 ],
                 "cast_detection_enabled": self.cast_detection_enabled,
                 "cast_candidate_min_fraction": self.cast_candidate_min_fraction,
@@ -699,7 +790,7 @@ class AppConfig:
                 },
                 "glow_red_ring_fraction": self.glow_red_ring_fraction,
                 "glow_override_cooldown_by_slot": [
-                    int(v) for v in list(self.glow_override_cooldown_by_slot or [])
+                    int(v) for v in (self.glow_override_cooldown_by_slot or ())
                 ],
                 "glow_confirm_frames": self.glow_confirm_frames,
                 "glow_yellow_hue_min": self.glow_yellow_hue_min,
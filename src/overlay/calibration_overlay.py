@@ -13,7 +13,7 @@ from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtGui import QPainter, QColor, QPen
 from PyQt6.QtWidgets import QWidget
 
-from src.models import BoundingBox
+from src.models import BoundingBox, SlotSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -97,7 +97,7 @@ class CalibrationOverlay(QWidget):
         }
         self.update()
 
-    def update_slot_states(self, states: list[dict]) -> None:
+    def update_slot_states(self, states: list[SlotSnapshot]) -> None:
         """Update per-slot live flags from analyzer output (e.g., glow-ready)."""
         by_index_ready: dict[int, bool] = {}
         by_index_candidate: dict[int, bool] = {}
@@ -108,21 +108,17 @@ class CalibrationOverlay(QWidget):
         by_index_red_ready: dict[int, bool] = {}
         by_index_red_candidate: dict[int, bool] = {}
         by_index_red_fraction: dict[int, float] = {}
-        for item in states or []:
-            if not isinstance(item, dict):
-                continue
-            idx = item.get("index")
-            if not isinstance(idx, int):
-                continue
-            by_index_ready[idx] = bool(item.get("glow_ready", False))
-            by_index_candidate[idx] = bool(item.get("glow_candidate", False))
-            by_index_fraction[idx] = float(item.get("glow_fraction", 0.0) or 0.0)
-            by_index_yellow_ready[idx] = bool(item.get("yellow_glow_ready", False))
-            by_index_yellow_candidate[idx] = bool(item.get("yellow_glow_candidate", False))
-            by_index_yellow_fraction[idx] = float(item.get("yellow_glow_fraction", 0.0) or 0.0)
-            by_index_red_ready[idx] = bool(item.get("red_glow_ready", False))
-            by_index_red_candidate[idx] = bool(item.get("red_glow_candidate", False))
-            by_index_red_fraction[idx] = float(item.get("red_glow_fraction", 0.0) or 0.0)
+        for s in states or []:
+            idx = s.index
+            by_index_ready[idx] = s.glow_ready
+            by_index_candidate[idx] = s.glow_candidate
+            by_index_fraction[idx] = s.glow_fraction
+            by_index_yellow_ready[idx] = s.yellow_glow_ready
+            by_index_yellow_candidate[idx] = s.yellow_glow_candidate
+            by_index_yellow_fraction[idx] = s.yellow_glow_fraction
+            by_index_red_ready[idx] = s.red_glow_ready
+            by_index_red_candidate[idx] = s.red_glow_candidate
+            by_index_red_fraction[idx] = s.red_glow_fraction
         self._slot_glow_ready = by_index_ready
         self._slot_glow_candidate = by_index_candidate
         self._slot_glow_fraction = by_index_fraction
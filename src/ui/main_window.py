@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import copy
-import json
 import logging
 import time
 from pathlib import Path
@@ -31,7 +30,8 @@ from PyQt6.QtWidgets import (
 
 import numpy as np
 
-from src.models import AppConfig, BoundingBox
+from src.models import SLOT_STATE_VALUES, AppConfig, BoundingBox, SlotSnapshot
+from src.models.config_io import write_json
 from src.ui.priority_panel import (
     MIME_PRIORITY_ITEM,
     PriorityPanel,
@@ -43,7 +43,7 @@ from src.automation.priority_rules import (
     manual_item_is_eligible,
     normalize_activation_rule,
     normalize_ready_source,
-    slot_item_is_eligible_for_state_dict,
+    slot_item_is_eligible_for_snapshot,
 )
 
 if TYPE_CHECKING:
@@ -352,7 +352,7 @@ class MainWindow(QMainWindow):
         self._slots_recalibrated: set[int] = set(
             getattr(config, "overwritten_baseline_slots", [])
         )
-        self._before_save_callback: Optional[Callable[[], None]] = None
+        self._before_save_callback: Optional[Callable[[Path], None]] = None
         self._last_saved_config: Optional[dict] = None
         self._last_action_sent_time: Optional[float] = (
             None  # for "time since last fire" on Next Intention + duration for new Last Action
@@ -803,16 +803,14 @@ class MainWindow(QMainWindow):
         self._priority_panel.priority_list.set_keybinds(self._config.keybinds)
         self._priority_panel.priority_list.update_states(
             [
-                {
-                    "index": i,
-                    "state": "unknown",
-                    "keybind": (
+                SlotSnapshot(
+                    index=i,
+                    keybind=(
                         self._config.keybinds[i]
                         if i < len(self._config.keybinds)
                         else None
                     ),
-                    "cooldown_remaining": None,
-                }
+                )
                 for i in range(n)
             ]
         )
@@ -999,8 +997,10 @@ class MainWindow(QMainWindow):
         """
         h, w, ch = frame.shape
         bytes_per_line = ch * w
-        rgb = frame[:, :, ::-1].copy()
-        qimg = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        # The frame is a strided view into the worker's capture buffer; a contiguous copy
+        # in BGR order is all QImage needs (no per-pixel channel swap).
+        bgr = np.ascontiguousarray(frame)
+        qimg = QImage(bgr.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
         pixmap = QPixmap.fromImage(qimg)
 
         max_w = max(1, self._preview_label.width() - 2 * self.PREVIEW_PADDING)
@@ -1046,9 +1046,9 @@ class MainWindow(QMainWindow):
         font.setBold(idx >= 0 and idx in self._slots_recalibrated)
         btn.setFont(font)
 
-    def _next_priority_candidate(self, states: list[dict]) -> Optional[dict]:
+    def _next_priority_candidate(self, states: list[SlotSnapshot]) -> Optional[dict]:
         """Return first eligible priority item with display fields for Next Intention."""
-        by_index = {s["index"]: s for s in states}
+        by_index = {s.index: s for s in states}
         manual_by_id = {
             str(a.get("id", "") or "").strip().lower(): a
             for a in self._active_manual_actions()
@@ -1060,7 +1060,7 @@ class MainWindow(QMainWindow):
                 if not isinstance(slot_index, int):
                     continue
                 slot = by_index.get(slot_index)
-                if not slot_item_is_eligible_for_state_dict(
+                if not slot_item_is_eligible_for_snapshot(
                     item, slot, buff_states=self._buff_states
                 ):
                     continue
@@ -1100,10 +1100,10 @@ class MainWindow(QMainWindow):
         return None
 
     def _next_casting_priority_slot(
-        self, states: list[dict]
+        self, states: list[SlotSnapshot]
     ) -> tuple[Optional[int], Optional[float]]:
         """First slot in priority order currently casting/channeling and its cast_ends_at."""
-        by_index = {s["index"]: s for s in states}
+        by_index = {s.index: s for s in states}
         for item in self._active_priority_items():
             if str(item.get("type", "") or "").strip().lower() != "slot":
                 continue
@@ -1113,13 +1113,13 @@ class MainWindow(QMainWindow):
             slot = by_index.get(slot_index)
             if not slot:
                 continue
-            if slot.get("state") in ("casting", "channeling"):
-                return slot_index, slot.get("cast_ends_at")
+            if slot.is_casting:
+                return slot_index, slot.cast_ends_at
         return None, None
 
-    def _next_ready_priority_slot(self, states: list[dict]) -> Optional[int]:
+    def _next_ready_priority_slot(self, states: list[SlotSnapshot]) -> Optional[int]:
         """Return first READY slot index from active priority items, or None."""
-        by_index = {s["index"]: s for s in states}
+        by_index = {s.index: s for s in states}
         for item in self._active_priority_items():
             if str(item.get("type", "") or "").strip().lower() != "slot":
                 continue
@@ -1127,7 +1127,7 @@ class MainWindow(QMainWindow):
             if not isinstance(slot_index, int):
                 continue
             slot = by_index.get(slot_index)
-            if slot_item_is_eligible_for_state_dict(
+            if slot_item_is_eligible_for_snapshot(
                 item, slot, buff_states=self._buff_states
             ):
                 return slot_index
@@ -1409,10 +1409,10 @@ class MainWindow(QMainWindow):
             return
         super().keyPressEvent(event)
 
-    def update_slot_states(self, states: list[dict]) -> None:
+    def update_slot_states(self, states: list[SlotSnapshot]) -> None:
         """Update the slot state indicators (QPushButtons with keybind + state color).
         Args:
-            states: List of dicts with keys: index, state, keybind, cooldown_remaining
+            states: Slot snapshots from the analyzer for the current frame
         """
         # Ignore transient empty payloads while capture is running to avoid
         # rebuilding the slot row and causing visible geometry churn.
@@ -1435,14 +1435,12 @@ class MainWindow(QMainWindow):
                 self._slot_buttons.append(btn)
             self._slot_states_row.set_buttons(self._slot_buttons)
         for btn, s in zip(self._slot_buttons, states):
-            keybind = s.get("keybind")
-            if keybind is None and s["index"] < len(self._config.keybinds):
-                keybind = self._config.keybinds[s["index"]] or None
+            keybind = s.keybind
+            if keybind is None and s.index < len(self._config.keybinds):
+                keybind = self._config.keybinds[s.index] or None
             keybind = keybind or "?"
-            state = s.get("state", "unknown")
-            cd = s.get("cooldown_remaining")
             self._apply_slot_button_style(
-                btn, state, keybind, cd, slot_index=s["index"]
+                btn, SLOT_STATE_VALUES[s.state], keybind, s.cooldown_remaining, slot_index=s.index
             )
         self._priority_panel.priority_list.set_keybinds(self._config.keybinds)
         self._priority_panel.priority_list.set_manual_actions(
@@ -1457,12 +1455,11 @@ class MainWindow(QMainWindow):
                 si = self._queued_override.get("slot_index")
                 if si is not None and si < len(names) and (names[si] or "").strip():
                     slot_name = (names[si] or "").strip()
-            states_by_idx = {s["index"]: s for s in states}
             slot_ready = False
             if self._queued_override.get("source") == "tracked":
                 si = self._queued_override.get("slot_index")
                 if si is not None:
-                    slot_ready = (states_by_idx.get(si) or {}).get("state") == "ready"
+                    slot_ready = any(s.index == si and s.is_ready for s in states)
             suffix = (
                 "queued (waiting)"
                 if not slot_ready and self._queued_override.get("source") == "tracked"
@@ -1499,8 +1496,8 @@ class MainWindow(QMainWindow):
             return
         self._next_intention_row.set_content("-", "no action", "", "#555")
 
-    def set_before_save_callback(self, callback: Optional[Callable[[], None]]) -> None:
-        """Set a callback run before writing config (e.g. to sync baselines from analyzer)."""
+    def set_before_save_callback(self, callback: Optional[Callable[[Path], None]]) -> None:
+        """Set a callback run with the destination path before writing config (e.g. to sync baselines)."""
         self._before_save_callback = callback
 
     def mark_slots_recalibrated(self, slot_indices: set[int]) -> None:
@@ -1522,10 +1519,9 @@ class MainWindow(QMainWindow):
         """Persist current config to JSON and show status message."""
         try:
             if self._before_save_callback:
-                self._before_save_callback()
+                self._before_save_callback(CONFIG_PATH)
             CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(self._config.to_dict(), f, indent=2)
+            write_json(CONFIG_PATH, self._config.to_dict())
             logger.info(f"Config saved to {CONFIG_PATH}")
             self._last_saved_config = copy.deepcopy(self._config.to_dict())
             self._show_status_message("Settings saved", 2000)
@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.automation.priority_rules import normalize_activation_rule, normalize_ready_source
+from src.models import SLOT_STATE_VALUES, SlotSnapshot
 
 
 logger = logging.getLogger(__name__)
@@ -488,13 +489,13 @@ class PriorityListWidget(QWidget):
     def get_items(self) -> list[dict]:
         return [dict(i) for i in self._items]
 
-    def update_states(self, states: list[dict]) -> None:
+    def update_states(self, states: list[SlotSnapshot]) -> None:
         by_index = {
-            s["index"]: (
-                s.get("state", "unknown"),
-                s.get("cooldown_remaining"),
-                s.get("cast_progress"),
-                s.get("cast_ends_at"),
+            s.index: (
+                SLOT_STATE_VALUES[s.state],
+                s.cooldown_remaining,
+                s.cast_progress,
+                s.cast_ends_at,
             )
             for s in states
         }
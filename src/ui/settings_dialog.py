@@ -1,7 +1,6 @@
 """Settings window - non-modal dialog for all configuration (Profile, Display, Capture, Detection, Automation, Calibration)."""
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +30,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.models import AppConfig, BoundingBox
+from src.models.config_io import decode_baselines, encode_baselines, read_json, write_json
 from src.automation.global_hotkey import CaptureOneKeyThread, format_bind_for_display
 from src.automation.binds import normalize_bind
 from src.ui.themes import load_theme
@@ -94,11 +94,12 @@ class SettingsDialog(QDialog):
     slot_layout_changed = pyqtSignal(int, int, int)
     overlay_visibility_changed = pyqtSignal(bool)
     monitor_changed = pyqtSignal(int)
+    baselines_imported = pyqtSignal(object)  # dict[int, np.ndarray] from an imported config
 
     def __init__(
         self,
         config: AppConfig,
-        before_save_callback: Optional[Callable[[], None]] = None,
+        before_save_callback: Optional[Callable[[Path], None]] = None,
         parent: Optional[QWidget] = None,
     ):
         super().__init__(parent)
@@ -1196,10 +1197,9 @@ class SettingsDialog(QDialog):
         self._update_status_bar()
         try:
             if self._before_save_callback:
-                self._before_save_callback()
+                self._before_save_callback(CONFIG_PATH)
             CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(self._config.to_dict(), f, indent=2)
+            write_json(CONFIG_PATH, self._config.to_dict())
             self._last_auto_saved = datetime.now()
             logger.info(f"Config auto-saved to {CONFIG_PATH}")
         except Exception as e:
@@ -1228,9 +1228,8 @@ class SettingsDialog(QDialog):
             return
         try:
             if self._before_save_callback:
-                self._before_save_callback()
-            with open(path, "w") as f:
-                json.dump(self._config.to_dict(), f, indent=2)
+                self._before_save_callback(Path(path))
+            write_json(path, self._config.to_dict())
             logger.info(f"Config exported to {path}")
         except Exception as e:
             logger.error(f"Export failed: {e}")
@@ -1242,14 +1241,23 @@ class SettingsDialog(QDialog):
         if not path:
             return
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = read_json(path)
             self._config = AppConfig.from_dict(data)
+            baselines = {}
+            if self._config.slot_baselines:
+                try:
+                    # A sidecar pointer is relative to the imported file, not to CONFIG_PATH.
+                    baselines = decode_baselines(self._config.slot_baselines, path)
+                except Exception as e:
+                    logger.warning(f"Could not load baselines from {path}: {e}")
+            # Embedded, so the saved copy no longer depends on where the imported file lives.
+            self._config.slot_baselines = encode_baselines(baselines)
+            if baselines:
+                self.baselines_imported.emit(baselines)
             self.sync_from_config()
             self._emit_config()
             CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(self._config.to_dict(), f, indent=2)
+            write_json(CONFIG_PATH, self._config.to_dict())
             logger.info(f"Config imported from {path}")
         except Exception as e:
             logger.error(f"Import failed: {e}")
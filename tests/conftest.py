@@ -0,0 +1,3 @@
+# src.models imports src.automation.binds, whose package imports src.models back; importing
+# src.automation first lets every test module import src.models or src.analysis directly.
+import src.automation  # noqa: F401
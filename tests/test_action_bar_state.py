@@ -0,0 +1,31 @@
+import unittest
+
+from src.models import ActionBarState, SlotSnapshot, SlotState
+
+
+class ActionBarStatePartitionTests(unittest.TestCase):
+    def test_partitions_are_built_at_construction(self) -> None:
+        state = ActionBarState(
+            slots=[
+                SlotSnapshot(index=0, state=SlotState.READY),
+                SlotSnapshot(index=1, state=SlotState.ON_COOLDOWN),
+                SlotSnapshot(index=2, state=SlotState.CASTING),
+                SlotSnapshot(index=3, state=SlotState.CHANNELING),
+                SlotSnapshot(index=4, state=SlotState.GCD),
+                SlotSnapshot(index=5, state=SlotState.READY),
+            ]
+        )
+        self.assertEqual([s.index for s in state.ready_slots()], [0, 5])
+        self.assertEqual([s.index for s in state.cooldown_slots()], [1])
+        self.assertEqual([s.index for s in state.casting_slots()], [2, 3])
+        self.assertIs(state.ready_slots(), state.ready_slots())
+
+    def test_empty_state_has_empty_partitions(self) -> None:
+        state = ActionBarState()
+        self.assertEqual(
+            (state.ready_slots(), state.cooldown_slots(), state.casting_slots()), ([], [], [])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+
+from src.models import AppConfig
+
+
+def _two_profile_config() -> AppConfig:
+    return AppConfig.from_dict(
+        {
+            "priority_profiles": [
+                {
+                    "id": "main",
+                    "name": "Main",
+                    "priority_items": [{"type": "slot", "slot_index": 0}],
+                    "toggle_bind": "f1",
+                },
+                {
+                    "id": "aoe",
+                    "name": "AoE",
+                    "priority_items": [{"type": "slot", "slot_index": 2}],
+                    "single_fire_bind": "f2",
+                },
+            ],
+            "active_priority_profile_id": "main",
+        }
+    )
+
+
+class AppConfigVersionTests(unittest.TestCase):
+    def test_switching_active_profile_bumps_version(self) -> None:
+        config = _two_profile_config()
+        before = config.version
+        self.assertTrue(config.set_active_priority_profile("aoe"))
+        self.assertGreater(config.version, before)
+
+    def test_selecting_current_profile_keeps_version(self) -> None:
+        config = _two_profile_config()
+        before = config.version
+        self.assertFalse(config.set_active_priority_profile("main"))
+        self.assertEqual(config.version, before)
+
+    def test_normalization_repairing_active_profile_bumps_version(self) -> None:
+        config = _two_profile_config()
+        config.active_priority_profile_id = "missing"
+        before = config.version
+        config.ensure_priority_profiles()
+        self.assertEqual(config.active_priority_profile_id, "main")
+        self.assertGreater(config.version, before)
+
+
+class ProfileNormalizationMemoTests(unittest.TestCase):
+    def test_in_place_item_edit_is_normalized_after_mark_changed(self) -> None:
+        config = _two_profile_config()
+        profile = config.get_active_priority_profile()
+        profile["priority_items"][0]["activation_rule"] = " DOT_REFRESH "
+        profile["toggle_bind"] = "Control + 1"
+        config.mark_changed()
+        self.assertEqual(config.active_priority_items()[0]["activation_rule"], "dot_refresh")
+        self.assertEqual(config.get_active_priority_profile()["toggle_bind"], "ctrl+1")
+
+    def test_in_place_edit_without_mark_changed_keeps_memo(self) -> None:
+        config = _two_profile_config()
+        config.get_active_priority_profile()["toggle_bind"] = "Control + 1"
+        self.assertEqual(config.get_active_priority_profile()["toggle_bind"], "Control + 1")
+        config.ensure_priority_profiles()
+        self.assertEqual(config.get_active_priority_profile()["toggle_bind"], "ctrl+1")
+
+    def test_switching_profiles_renormalizes_and_returns_new_items(self) -> None:
+        config = _two_profile_config()
+        self.assertEqual([i["slot_index"] for i in config.active_priority_items()], [0])
+        config.priority_profiles[1]["priority_items"].append({"type": "slot", "slot_index": 5})
+        self.assertTrue(config.set_active_priority_profile("aoe"))
+        items = config.active_priority_items()
+        self.assertEqual([i["slot_index"] for i in items], [2, 5])
+        self.assertEqual(items[1]["activation_rule"], "always")
+        self.assertEqual(config.priority_order, [2, 5])
+
+    def test_appended_profile_is_normalized_without_mark_changed(self) -> None:
+        config = _two_profile_config()
+        config.priority_profiles.append({"id": " New ", "priority_items": [3]})
+        self.assertTrue(config.set_active_priority_profile("new"))
+        self.assertEqual(config.get_active_priority_profile()["priority_order"], [3])
+
+
+class NormalizePriorityItemsTests(unittest.TestCase):
+    def test_returns_items_and_slot_order_in_one_pass(self) -> None:
+        items, slot_order = AppConfig._normalize_priority_items(
+            [
+                3,
+                {"type": "manual", "action_id": " Kick "},
+                {"type": " SLOT ", "slot_index": 1, "activation_rule": "DOT_REFRESH"},
+                {"type": "slot", "slot_index": "2"},
+                "junk",
+            ],
+            [9],
+        )
+        self.assertEqual(slot_order, [3, 1])
+        self.assertEqual([i["type"] for i in items], ["slot", "manual", "slot"])
+        self.assertEqual(
+            items[1],
+            {"type": "manual", "action_id": "kick", "ready_source": "always", "buff_roi_id": ""},
+        )
+        self.assertEqual(items[2]["activation_rule"], "dot_refresh")
+        self.assertEqual(items[2]["ready_source"], "slot")
+
+    def test_unknown_manual_ids_are_dropped_without_triggering_fallback(self) -> None:
+        items, slot_order = AppConfig._normalize_priority_items(
+            [{"type": "manual", "action_id": "stale"}], [4], manual_action_ids={"kick"}
+        )
+        self.assertEqual((items, slot_order), ([], []))
+
+    def test_falls_back_to_slot_order_when_nothing_is_valid(self) -> None:
+        items, slot_order = AppConfig._normalize_priority_items(
+            [{"type": "slot", "slot_index": None}], [2, "x", 0]
+        )
+        self.assertEqual(slot_order, [2, 0])
+        self.assertEqual([i["slot_index"] for i in items], [2, 0])
+        self.assertTrue(all(i["activation_rule"] == "always" for i in items))
+
+
+class SlotDetectionParsingTests(unittest.TestCase):
+    def test_value_map_casts_clamps_and_skips_bad_entries(self) -> None:
+        parsed = AppConfig._parse_slot_value_map(
+            {"0": "12", "1": 300, "-1": 5, "x": 5, "2": "nan?"}, int, 0, 255
+        )
+        self.assertEqual(parsed, {0: 12, 1: 255})
+        self.assertEqual(AppConfig._parse_slot_value_map([1, 2], float, 0.0, 1.0), {})
+
+    def test_index_list_drops_invalid_negative_and_duplicates(self) -> None:
+        self.assertEqual(AppConfig._parse_slot_index_list(["3", 1, -2, "x", 3, None, 1.0]), [3, 1])
+        self.assertEqual(AppConfig._parse_slot_index_list({"0": 1}), [])
+
+    def test_from_dict_uses_parsed_detection_maps(self) -> None:
+        config = AppConfig.from_dict(
+            {
+                "detection": {
+                    "glow_ring_fraction_by_slot": {"1": 1.5, "bad": 0.2},
+                    "glow_override_cooldown_by_slot": [2, "2", -1],
+                }
+            }
+        )
+        self.assertEqual(config.glow_ring_fraction_by_slot, {1: 1.0})
+        self.assertEqual(config.glow_override_cooldown_by_slot, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
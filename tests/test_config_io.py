@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.models.config_io import decode_baselines, encode_baselines, write_baselines_sidecar
+
+
+def _baselines() -> dict[int, np.ndarray]:
+    rng = np.random.default_rng(3)
+    return {
+        0: rng.integers(0, 256, (14, 14), dtype=np.uint8),
+        3: rng.integers(0, 256, (10, 12), dtype=np.uint8),
+    }
+
+
+class BaselineRoundTripTests(unittest.TestCase):
+    def assertBaselinesEqual(self, actual: dict, expected: dict) -> None:
+        self.assertEqual(sorted(actual), sorted(expected))
+        for idx, ary in expected.items():
+            np.testing.assert_array_equal(actual[idx], ary)
+
+    def test_embedded_round_trip_keeps_sparse_slot_indices(self) -> None:
+        baselines = _baselines()
+        encoded = encode_baselines(baselines)
+        self.assertEqual(len(encoded), 4)
+        self.assertEqual(encoded[1], {})
+        self.assertBaselinesEqual(decode_baselines(encoded, "unused.json"), baselines)
+
+    def test_sidecar_round_trip_resolves_next_to_config_file(self) -> None:
+        baselines = _baselines()
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "exports" / "raid.json"
+            pointer = write_baselines_sidecar(config_path, baselines)
+            self.assertEqual(pointer, {"path": "raid.baselines.npz"})
+            self.assertTrue((config_path.parent / pointer["path"]).is_file())
+            self.assertBaselinesEqual(decode_baselines(pointer, config_path), baselines)
+
+    def test_sidecars_are_per_config_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first = Path(tmp) / "a.json"
+            second = Path(tmp) / "b.json"
+            write_baselines_sidecar(first, {0: np.zeros((2, 2), dtype=np.uint8)})
+            pointer = write_baselines_sidecar(second, {0: np.ones((2, 2), dtype=np.uint8)})
+            self.assertEqual(decode_baselines(pointer, second)[0].tolist(), [[1, 1], [1, 1]])
+            self.assertEqual(
+                decode_baselines({"path": "a.baselines.npz"}, first)[0].tolist(), [[0, 0], [0, 0]]
+            )
+
+    def test_empty_pointer_decodes_to_no_baselines(self) -> None:
+        self.assertEqual(decode_baselines({}, "config/config.json"), {})
+        self.assertEqual(decode_baselines([], "config/config.json"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,21 @@
 import unittest
 
-from src.automation.priority_rules import (
-    slot_item_is_eligible_for_snapshot,
-    slot_item_is_eligible_for_state_dict,
-)
+from src.automation.priority_rules import slot_item_is_eligible_for_snapshot
 from src.models import SlotSnapshot, SlotState
 
 
+def _snapshot(slot_state: dict) -> SlotSnapshot:
+    """Build the SlotSnapshot the analyzer would emit for a {state, *_glow_ready} dict."""
+    return SlotSnapshot(
+        index=0,
+        state=SlotState[str(slot_state.get("state", "unknown")).upper()],
+        yellow_glow_ready=bool(slot_state.get("yellow_glow_ready", False)),
+        red_glow_ready=bool(slot_state.get("red_glow_ready", False)),
+    )
+
+
 class PriorityRulesTests(unittest.TestCase):
-    def test_buff_gated_dot_refresh_does_not_bypass_failed_buff_gate_when_slot_not_ready_state_dict(
+    def test_buff_gated_dot_refresh_does_not_bypass_failed_buff_gate_when_slot_not_ready(
         self,
     ) -> None:
         item = {
@@ -25,10 +32,10 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": True, "status": "ok"}}
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_dot_refresh_can_bypass_failed_buff_gate_when_slot_ready_state_dict(
+    def test_buff_gated_dot_refresh_can_bypass_failed_buff_gate_when_slot_ready(
         self,
     ) -> None:
         item = {
@@ -52,10 +59,10 @@ class PriorityRulesTests(unittest.TestCase):
             }
         }
         self.assertTrue(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_dot_refresh_stays_blocked_without_red_glow_state_dict(self) -> None:
+    def test_buff_gated_dot_refresh_stays_blocked_without_red_glow(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -70,10 +77,10 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": True, "status": "ok"}}
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_dot_refresh_requires_slot_ready_without_red_override_state_dict(self) -> None:
+    def test_buff_gated_dot_refresh_requires_slot_ready_without_red_override(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -88,10 +95,10 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": False, "status": "ok"}}
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_dot_refresh_allows_red_override_when_buff_gate_passes_state_dict(self) -> None:
+    def test_buff_gated_dot_refresh_allows_red_override_when_buff_gate_passes(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -113,10 +120,10 @@ class PriorityRulesTests(unittest.TestCase):
             }
         }
         self.assertTrue(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_requires_slot_ready_even_when_buff_gate_passes_state_dict(self) -> None:
+    def test_buff_gated_requires_slot_ready_even_when_buff_gate_passes(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -131,10 +138,10 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": False, "status": "ok"}}
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_eligible_when_buff_gate_and_slot_ready_state_dict(self) -> None:
+    def test_buff_gated_eligible_when_buff_gate_and_slot_ready(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -149,10 +156,10 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": False, "status": "ok"}}
         self.assertTrue(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
-    def test_buff_gated_always_does_not_use_red_glow_override_state_dict(self) -> None:
+    def test_buff_gated_always_does_not_use_red_glow_override(self) -> None:
         item = {
             "type": "slot",
             "slot_index": 0,
@@ -167,7 +174,7 @@ class PriorityRulesTests(unittest.TestCase):
         }
         buff_states = {"dot1": {"calibrated": True, "present": True, "status": "ok"}}
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
     def test_buff_missing_not_eligible_when_buff_status_not_ok(self) -> None:
@@ -183,7 +190,7 @@ class PriorityRulesTests(unittest.TestCase):
             "dot1": {"calibrated": True, "present": False, "status": "out-of-frame"}
         }
         self.assertFalse(
-            slot_item_is_eligible_for_state_dict(item, slot_state, buff_states=buff_states)
+            slot_item_is_eligible_for_snapshot(item, _snapshot(slot_state), buff_states=buff_states)
         )
 
     def test_slot_source_dot_refresh_behavior_is_unchanged_snapshot(self) -> None:
@@ -201,6 +208,17 @@ class PriorityRulesTests(unittest.TestCase):
         )
         self.assertFalse(slot_item_is_eligible_for_snapshot(item, slot, buff_states={}))
 
+    def test_plain_slot_item_follows_slot_readiness(self) -> None:
+        item = {"type": "slot", "slot_index": 0}
+        self.assertTrue(
+            slot_item_is_eligible_for_snapshot(item, SlotSnapshot(index=0, state=SlotState.READY))
+        )
+        self.assertFalse(
+            slot_item_is_eligible_for_snapshot(
+                item, SlotSnapshot(index=0, state=SlotState.ON_COOLDOWN)
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
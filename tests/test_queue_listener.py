@@ -0,0 +1,85 @@
+import sys
+import threading
+import types
+import unittest
+
+from src.automation.queue_listener import _QueueHookThread
+from src.models import AppConfig
+
+
+class _FakeKeyboard(types.ModuleType):
+    """Stand-in for the keyboard package: records the hook so tests can feed it events."""
+
+    KEY_DOWN = "down"
+
+    def __init__(self) -> None:
+        super().__init__("keyboard")
+        self.handler = None
+        self.hooked = threading.Event()
+
+    def hook(self, handler):
+        self.handler = handler
+        self.hooked.set()
+        return handler
+
+    def unhook(self, _hook) -> None:
+        self.handler = None
+
+    def key_to_scan_codes(self, name):
+        return (ord(name[0]),)
+
+
+def _press(keyboard: _FakeKeyboard, name: str) -> None:
+    keyboard.handler(types.SimpleNamespace(event_type="down", name=name, scan_code=ord(name[0])))
+
+
+class QueueHookProfileSwitchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = AppConfig.from_dict(
+            {
+                "slots": {"count": 3, "keybinds": ["1", "2", "3"]},
+                "priority_profiles": [
+                    {"id": "main", "priority_items": [{"type": "slot", "slot_index": 0}]},
+                    {"id": "aoe", "priority_items": [{"type": "slot", "slot_index": 1}]},
+                ],
+                "active_priority_profile_id": "main",
+            }
+        )
+        self.config.automation_enabled = True
+        self.queue = None
+        self.keyboard = _FakeKeyboard()
+        self._saved_keyboard = sys.modules.get("keyboard")
+        sys.modules["keyboard"] = self.keyboard
+        self.hook_thread = _QueueHookThread(
+            lambda: self.config, lambda: self.queue, self._set_queue
+        )
+        self.runner = threading.Thread(target=self.hook_thread.run, daemon=True)
+        self.runner.start()
+        self.assertTrue(self.keyboard.hooked.wait(2.0))
+
+    def tearDown(self) -> None:
+        self.hook_thread.stop()
+        self.runner.join(2.0)
+        if self._saved_keyboard is None:
+            sys.modules.pop("keyboard", None)
+        else:
+            sys.modules["keyboard"] = self._saved_keyboard
+
+    def _set_queue(self, value: dict) -> None:
+        self.queue = value
+
+    def test_profile_switch_makes_new_priority_key_untracked(self) -> None:
+        _press(self.keyboard, "2")
+        self.assertEqual(self.queue, {"key": "2", "slot_index": 1, "source": "tracked"})
+
+        self.assertTrue(self.config.set_active_priority_profile("aoe"))
+        self.queue = None
+        _press(self.keyboard, "2")
+        self.assertIsNone(self.queue)
+
+        _press(self.keyboard, "1")
+        self.assertEqual(self.queue, {"key": "1", "slot_index": 0, "source": "tracked"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import time
+import unittest
+
+import numpy as np
+
+from src.analysis.slot_analyzer import SlotAnalyzer
+from src.models import ActionBarState, AppConfig, SlotState
+
+
+def _analyzer(slot_count: int = 4, gate_threshold: float = 0.0) -> SlotAnalyzer:
+    return SlotAnalyzer(
+        AppConfig.from_dict(
+            {
+                "bounding_box": {"top": 0, "left": 0, "width": slot_count * 22, "height": 20},
+                "slots": {"count": slot_count, "gap_pixels": 2, "padding": 3},
+                "detection": {"frame_change_gate_threshold": gate_threshold},
+            }
+        )
+    )
+
+
+def _reference_stats(baseline: np.ndarray, gray: np.ndarray, thresh: int) -> tuple[float, float]:
+    delta = baseline.astype(np.int16) - gray.astype(np.int16)
+    return float(np.mean(delta > thresh)), float(np.mean(np.abs(delta) > thresh))
+
+
+class PixelChangeStatsTests(unittest.TestCase):
+    def test_count_above_per_slot_counts_each_band(self) -> None:
+        diff = np.zeros((6, 4), dtype=np.uint8)
+        diff[0, :3] = 50
+        diff[4:, :] = 41
+        diff[5, 0] = 40
+        counts = SlotAnalyzer._count_above_per_slot(diff, 40, 3)
+        self.assertEqual(counts.tolist(), [3, 0, 7])
+
+    def test_stacked_stats_match_per_slot_reference(self) -> None:
+        analyzer = _analyzer()
+        rng = np.random.default_rng(7)
+        grays = [rng.integers(0, 256, (14, 14), dtype=np.uint8) for _ in range(3)]
+        grays.append(rng.integers(0, 256, (10, 14), dtype=np.uint8))
+        baselines = {
+            0: rng.integers(0, 256, (14, 14), dtype=np.uint8),
+            1: rng.integers(0, 256, (14, 14), dtype=np.uint8),
+            3: rng.integers(0, 256, (10, 14), dtype=np.uint8),
+        }
+        analyzer.set_baselines(baselines)
+
+        stats = analyzer._pixel_change_stats(grays, 40)
+
+        self.assertIsNone(stats[2])
+        for idx, baseline in baselines.items():
+            expected = _reference_stats(baseline, grays[idx], 40)
+            self.assertAlmostEqual(stats[idx][0], expected[0])
+            self.assertAlmostEqual(stats[idx][1], expected[1])
+
+    def test_mismatched_or_empty_crops_are_not_comparable(self) -> None:
+        analyzer = _analyzer(slot_count=2)
+        baseline = np.zeros((14, 14), dtype=np.uint8)
+        analyzer.set_baselines({0: baseline, 1: baseline})
+        grays = [np.zeros((12, 14), dtype=np.uint8), np.zeros((0, 14), dtype=np.uint8)]
+        self.assertEqual(analyzer._pixel_change_stats(grays, 40), [None, None])
+
+    def test_new_baselines_replace_cached_stack(self) -> None:
+        analyzer = _analyzer(slot_count=1)
+        gray = np.full((14, 14), 100, dtype=np.uint8)
+        analyzer.set_baselines({0: np.full((14, 14), 100, dtype=np.uint8)})
+        self.assertEqual(analyzer._pixel_change_stats([gray], 40), [(0.0, 0.0)])
+        analyzer.set_baselines({0: np.full((14, 14), 200, dtype=np.uint8)})
+        self.assertEqual(analyzer._pixel_change_stats([gray], 40), [(1.0, 1.0)])
+
+
+class FrameChangeGateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.frame = np.full((20, 88, 3), 120, dtype=np.uint8)
+
+    def _calibrated(self, gate_threshold: float) -> SlotAnalyzer:
+        analyzer = _analyzer(gate_threshold=gate_threshold)
+        analyzer.calibrate_baselines(self.frame)
+        return analyzer
+
+    def _analyze(self, analyzer: SlotAnalyzer, frame: np.ndarray) -> tuple[ActionBarState, bool]:
+        """Analyze frame; also return whether it went through the full (ungated) analysis."""
+        before = analyzer._analyze_frame_count
+        state = analyzer.analyze_frame(frame)
+        return state, analyzer._analyze_frame_count != before
+
+    def _darkened(self) -> np.ndarray:
+        darkened = self.frame.copy()
+        darkened[:, :22] = 20
+        return darkened
+
+    def test_unchanged_frame_reuses_last_states_with_fresh_timestamps(self) -> None:
+        analyzer = self._calibrated(2.0)
+        first, _ = self._analyze(analyzer, self.frame)
+        time.sleep(0.002)
+        second, full = self._analyze(analyzer, self.frame.copy())
+        self.assertFalse(full)
+        self.assertEqual([s.state for s in second.slots], [s.state for s in first.slots])
+        self.assertGreater(second.timestamp, first.timestamp)
+        self.assertTrue(all(s.timestamp == second.timestamp for s in second.slots))
+        self.assertEqual(len(second.ready_slots()), len(first.ready_slots()))
+
+    def test_threshold_is_a_mean_delta_independent_of_capture_size(self) -> None:
+        for width in (88, 880):
+            analyzer = _analyzer(gate_threshold=2.0)
+            frame = np.full((20, width, 3), 120, dtype=np.uint8)
+            analyzer.calibrate_baselines(frame)
+            analyzer.analyze_frame(frame)
+            _, full = self._analyze(analyzer, frame + 1)
+            self.assertFalse(full, width)
+            _, full = self._analyze(analyzer, frame + 3)
+            self.assertTrue(full, width)
+
+    def test_gate_disabled_by_default(self) -> None:
+        analyzer = self._calibrated(0)
+        analyzer.analyze_frame(self.frame)
+        self.assertTrue(self._analyze(analyzer, self.frame)[1])
+
+    def test_changed_frame_is_fully_analyzed(self) -> None:
+        analyzer = self._calibrated(2.0)
+        analyzer.analyze_frame(self.frame)
+        state, full = self._analyze(analyzer, self._darkened())
+        self.assertTrue(full)
+        self.assertEqual(state.slots[0].state, SlotState.GCD)
+
+    def test_pending_cooldown_transition_bypasses_gate(self) -> None:
+        analyzer = self._calibrated(2.0)
+        analyzer.analyze_frame(self.frame)
+        analyzer.analyze_frame(self._darkened())
+        self.assertTrue(self._analyze(analyzer, self._darkened())[1])
+
+    def test_new_baselines_invalidate_cached_state(self) -> None:
+        analyzer = self._calibrated(2.0)
+        analyzer.analyze_frame(self.frame)
+        analyzer.set_baselines(analyzer.get_baselines())
+        self.assertTrue(self._analyze(analyzer, self.frame)[1])
+
+    def test_config_update_invalidates_cached_state(self) -> None:
+        analyzer = self._calibrated(2.0)
+        analyzer.analyze_frame(self.frame)
+        analyzer.update_config(analyzer._config)
+        self.assertTrue(self._analyze(analyzer, self.frame)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()